@@ -13,10 +13,18 @@ Pipeline indépendante de collecte des données d'exportation depuis Comtrade.
 
 import sys
 import os
+import re
+import codecs
+import argparse
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.compute as pc
 from pathlib import Path
+from functools import reduce
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
-import pickle
 import json
 
 # Permet d'importer toolkit même si on lance depuis pipeline/
@@ -33,7 +41,7 @@ EXPORT_PERIODS = [tuple(period) for period in config["EXPORT_PERIODS"]]
 CLEAR_CACHE = config["CLEAR_CACHE"]
 LOG_LEVEL = config["LOG_LEVEL"]
 
-from utils.utils import fetch_comtrade_exports, clean_iso_codes
+from utils.utils import fetch_comtrade_exports, clean_iso_codes, get_exports_cache_path, save_exports_cache, load_exports_cache
 
 logger.remove()
 logger.add(sys.stderr, level=LOG_LEVEL)
@@ -47,108 +55,260 @@ Path(config.get("RESULTS_DIR", "results")).mkdir(parents=True, exist_ok=True)
 Path(config.get("TABLES_DIR", "results/tables")).mkdir(parents=True, exist_ok=True)
 
 
-def get_cache_path(data_type: str) -> Path:
-    return CACHE_DIR / f"{data_type}.pkl"
+def get_cache_path(period_name: str) -> Path:
+    return get_exports_cache_path(CACHE_DIR, period_name)
+
+
+# Résumés par période ({period: {n_obs, an_min, an_max, n_iso, n_prod}}) stockés à côté du cache
+SUMMARY_PATH = CACHE_DIR / "exports_summary.json"
+
+
+def compute_exports_summary(df: pd.DataFrame) -> dict:
+    return {
+        "n_obs": len(df),
+        "an_min": int(df['Year'].min()) if 'Year' in df.columns else 'N/A',
+        "an_max": int(df['Year'].max()) if 'Year' in df.columns else 'N/A',
+        "n_iso": int(df['ISO'].nunique()) if 'ISO' in df.columns else 'N/A',
+        "n_prod": int(df['cmdCode'].nunique()) if 'cmdCode' in df.columns else 'N/A',
+    }
+
+
+def write_exports_summary(summaries: dict, path: Path = SUMMARY_PATH) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(summaries, f, indent=2)
+
+
+def read_exports_summary(path: Path = SUMMARY_PATH) -> dict:
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Résumé exports illisible ({path.name}): {e}")
+        return {}
+
+
+def log_exports_summary(label: str, summary: dict) -> None:
+    # Logger résumé façon tableau avec smileys
+    logger.info(
+        f"\n📊 RÉSUMÉ EXPORTS {label}\n"
+        f"  • 📦 Observations : {summary['n_obs']:,}\n"
+        f"  • 📅 Années       : {summary['an_min']}–{summary['an_max']}\n"
+        f"  • 🌍 Pays         : {summary['n_iso']}\n"
+        f"  • 🏷️ Produits     : {summary['n_prod']}\n"
+    )
+
+
+# Codes produits agricoles selon la nomenclature (SITC2 : entiers, HS : chapitres "01"-"24")
+S2_AGRI_CODES = frozenset([
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9,
+    21, 22, 23, 24, 25, 29,
+    41, 42, 43
+])
+H0_AGRI_CODES = frozenset(f"{i:02}" for i in range(1, 25))
+
+# Colonnes brutes Comtrade réellement utilisées, avec typage explicite (pas d'inférence par fichier)
+EXPORT_CSV_SCHEMA = {
+    "refYear": pa.int16(),
+    "reporterISO": pa.string(),
+    "reporterDesc": pa.string(),
+    "classificationCode": pa.string(),
+    "classificationSearchCode": pa.string(),
+    "cmdCode": pa.string(),
+    "fobvalue": pa.float64(),
+}
+REQUIRED_COLS = list(EXPORT_CSV_SCHEMA)
+# Nom de fichier d'exports : plage d'années (1979-1987_exports_...) ou année simple (1988_exports_...)
+EXPORT_FILE_RE = re.compile(r"(?:(\d{4})-(\d{4})|(\d{4}))_exports")
+# Taille des blocs lus en streaming (~64K lignes Comtrade par bloc)
+CSV_BLOCK_SIZE = 16 << 20
+# Octets inspectés pour choisir l'encodage d'un fichier (UTF-8 sinon latin1)
+ENCODING_SNIFF_BYTES = 1 << 20
+
+
+def read_export_csv(path: Path, encoding: str = "utf8") -> pa.Table:
+    """
+    Lit un CSV Comtrade bloc par bloc avec le lecteur Arrow, en ne gardant que REQUIRED_COLS.
+
+    Les lignes avec une colonne requise vide ou sans fobvalue strictement positive sont écartées
+    dès la lecture de chaque bloc (un seul masque Arrow), si bien que le pic mémoire ne dépend
+    plus de la taille brute du fichier.
+    """
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(encoding=encoding, block_size=CSV_BLOCK_SIZE),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=REQUIRED_COLS,
+            include_missing_columns=True,
+            column_types=EXPORT_CSV_SCHEMA,
+            strings_can_be_null=True,
+        ),
+    )
+    def keep_mask(batch):
+        return reduce(
+            pc.and_,
+            (pc.is_valid(batch[col]) for col in REQUIRED_COLS),
+            pc.greater(batch["fobvalue"], 0),
+        )
+    batches = [batch.filter(keep_mask(batch)) for batch in reader]
+    return pa.Table.from_batches(batches, schema=reader.schema)
+
+
+def sniff_export_encoding(path: Path, n_bytes: int = ENCODING_SNIFF_BYTES) -> str:
+    # Décodage strict du début du fichier : évite une lecture complète ratée avant le repli latin1
+    with open(path, "rb") as f:
+        head = f.read(n_bytes)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf8"
+    except UnicodeDecodeError:
+        return "latin1"
 
 
 def load_exports_from_csv(year_range: tuple) -> pd.DataFrame:
-    import re
     start_year, end_year = year_range
     logger.info(f"Chargement exports CSV pour {start_year}-{end_year}")
     exports_dir = DATA_DIR / "exports"
     all_exports = []
     years_found = set()
-    # Recherche tous les fichiers CSV pertinents
-    csv_files = list(exports_dir.glob("*_exports*.csv"))
-    file_years_map = {}
-    for csv_file in csv_files:
-        fname = csv_file.name
-        # Plage d'années : 1979-1987_exports_...
-        m_range = re.match(r"(\d{4})-(\d{4})_exports", fname)
-        if m_range:
-            y0, y1 = int(m_range.group(1)), int(m_range.group(2))
-            covered = set(range(y0, y1 + 1))
+    # Recherche des fichiers CSV couvrant la période demandée (une seule passe, test d'intervalle)
+    files_to_load = []
+    for csv_file in exports_dir.glob("*_exports*.csv"):
+        m = EXPORT_FILE_RE.match(csv_file.name)
+        if not m:
+            continue
+        if m.group(1):
+            # Plage d'années : 1979-1987_exports_...
+            y0, y1 = int(m.group(1)), int(m.group(2))
         else:
             # Année simple : 1988_exports_...
-            m_single = re.match(r"(\d{4})_exports", fname)
-            if m_single:
-                y0 = int(m_single.group(1))
-                covered = {y0}
-            else:
-                continue
-        file_years_map[csv_file] = covered
-    # Sélectionne les fichiers couvrant la période demandée
-    target_years = set(range(start_year, end_year + 1))
-    files_to_load = []
-    for f, covered in file_years_map.items():
-        if covered & target_years:
-            files_to_load.append(f)
-            years_found |= (covered & target_years)
-    # Chargement des fichiers
-    for f in files_to_load:
+            y0 = y1 = int(m.group(3))
+        if y0 <= end_year and y1 >= start_year:
+            files_to_load.append(csv_file)
+            years_found.update(range(max(y0, start_year), min(y1, end_year) + 1))
+    # Chargement des fichiers en parallèle (le lecteur Arrow libère le GIL), ordre des fichiers conservé
+    def read_one(f):
         try:
+            encoding = sniff_export_encoding(f)
             try:
-                df = pd.read_csv(f)
-            except UnicodeDecodeError:
-                df = pd.read_csv(f, encoding="latin1")
-            all_exports.append(df)
+                return read_export_csv(f, encoding=encoding)
+            except pa.ArrowInvalid:
+                if encoding == "latin1":
+                    raise
+                # Octet non UTF-8 au-delà de l'en-tête inspecté : relecture en latin1
+                return read_export_csv(f, encoding="latin1")
         except Exception as e:
             logger.warning(f"Erreur lecture {f}: {e}")
+            return None
+    if files_to_load:
+        with ThreadPoolExecutor(max_workers=min(len(files_to_load), os.cpu_count() or 1)) as executor:
+            all_exports = [table for table in executor.map(read_one, files_to_load) if table is not None]
     if not all_exports:
         logger.error(f"Aucune donnée d'exports trouvée pour {start_year}-{end_year}")
         return pd.DataFrame()
-    df = pd.concat(all_exports, ignore_index=True)
+    # Concaténation sans copie (chunks Arrow), puis conversion qui libère les buffers au fil de l'eau ;
+    # un bloc pandas par colonne (split_blocks) évite la consolidation en blocs 2D du BlockManager
+    table = pa.concat_tables(all_exports)
+    all_exports.clear()
+    df = table.to_pandas(self_destruct=True, split_blocks=True)
+    del table
     # Harmonisation des colonnes (mapping direct)
     df = df.rename(columns={
         "refYear": "Year",
         "reporterISO": "ISO",
         "reporterDesc": "Country"
     })
+    # cmdCode est lu en texte : comme l'inférence pandas, on le repasse en numérique si tous les codes le sont
+    cmd_numeric = pd.to_numeric(df["cmdCode"], errors="coerce")
+    if cmd_numeric.notna().sum() == df["cmdCode"].notna().sum():
+        df["cmdCode"] = cmd_numeric
     # Nettoyage et exclusion des codes ISO
     excluded_iso_codes = config.get("EXCLUDED_ISO_CODES", [])
     df = clean_iso_codes(df, iso_col="ISO", exclude_iso_codes=excluded_iso_codes)
-    # Ajout colonne is_agri selon la nomenclature
-    S2_AGRI_CODES = [
-        0, 1, 2, 3, 4, 5, 6, 7, 8, 9,
-        21, 22, 23, 24, 25, 29,
-        41, 42, 43
-    ]
-    H0_AGRI_CODES = [f"{i:02}" for i in range(1, 25)]
-    def is_agri_row(row):
-        classif = str(row["classificationSearchCode"]).strip().upper().replace("SITC2", "S2")
-        if classif == "S2":
-            try:
-                code = int(str(row["cmdCode"]).strip())
-            except Exception:
-                logger.debug(f"cmdCode non convertible en int: {row['cmdCode']}")
-                return False
-            if code in S2_AGRI_CODES:
-                logger.trace(f"AGRI S2: {row['Country']} {row['ISO']} {row['Year']} cmdCode={code} => True")
-            return code in S2_AGRI_CODES
-        elif classif == "HS":
-            code = str(row["cmdCode"]).zfill(2)
-            return code in H0_AGRI_CODES
-        else:
-            logger.warning(f"classificationSearchCode inattendu: {classif}")
-            return False
-    df["is_agri"] = df.apply(is_agri_row, axis=1)
+    # Ajout colonne is_agri selon la nomenclature : table de correspondance (classification × cmdCode)
+    # évaluée une seule fois sur les valeurs distinctes, puis indexée par les codes factorisés de chaque ligne
+    cls_idx, cls_values = pd.factorize(df["classificationSearchCode"], use_na_sentinel=False)
+    cmd_idx, cmd_values = pd.factorize(df["cmdCode"], use_na_sentinel=False)
+    classif = (
+        pd.Series(cls_values).astype(str).str.strip().str.upper()
+        .str.replace("SITC2", "S2", regex=False)
+    )
+    is_s2 = (classif == "S2").to_numpy()
+    is_hs = (classif == "HS").to_numpy()
+    cmd_codes = pd.Series(cmd_values).astype(str)
+    codes_s2 = pd.to_numeric(cmd_codes.str.strip(), errors="coerce")
+    agri_s2 = codes_s2.isin(S2_AGRI_CODES).to_numpy()
+    agri_hs = cmd_codes.str.zfill(2).isin(H0_AGRI_CODES).to_numpy()
+    agri_lookup = np.outer(is_s2, agri_s2) | np.outer(is_hs, agri_hs)
+    df["is_agri"] = agri_lookup[cls_idx, cmd_idx]
+    # Un seul message agrégé pour les cmdCode SITC2 non convertibles en entier (jamais agricoles)
+    n_bad = int((is_s2[cls_idx] & codes_s2.isna().to_numpy()[cmd_idx]).sum())
+    if n_bad:
+        logger.debug(f"cmdCode non convertible en int sur {n_bad} lignes SITC2")
+    unexpected = ~(is_s2 | is_hs)
+    if unexpected.any():
+        n_unexpected = np.bincount(cls_idx, minlength=len(cls_values))[unexpected].sum()
+        logger.warning(
+            f"classificationSearchCode inattendu sur {int(n_unexpected)} lignes: "
+            f"{sorted(classif[unexpected].unique())}"
+        )
     logger.debug(f"Exports CSV chargées: {len(df)} lignes pour {start_year}-{end_year}")
     return df
 
 key_columns = ["Year", "Country", "ISO", "classificationCode", "classificationSearchCode", "cmdCode", "is_agri", "fobvalue"]
+
+
 def validate_exports_data(df: pd.DataFrame) -> pd.DataFrame:
     # Vérifier colonnes critiques harmonisées
     for col in key_columns:
         if col not in df.columns:
             logger.error(f"Colonne manquante: {col}")
             return pd.DataFrame()
-    df = df.dropna(subset=key_columns)
-    df = df[df["fobvalue"] > 0]
+    # Valeurs manquantes et fobvalue <= 0 déjà filtrées à la lecture (read_export_csv)
     return df
 
 
+# Colonnes texte à faible cardinalité, stockées en category (codes entiers + dictionnaire)
+CATEGORY_COLUMNS = ["ISO", "Country", "classificationCode", "classificationSearchCode"]
+
+
+def downcast_exports(df: pd.DataFrame) -> pd.DataFrame:
+    # Types réduits avant mise en cache (fobvalue reste en float64 : valeurs monétaires)
+    dtypes = {col: "category" for col in CATEGORY_COLUMNS if col in df.columns}
+    dtypes["Year"] = "int16"
+    if pd.api.types.is_integer_dtype(df["cmdCode"]):
+        df = df.assign(cmdCode=pd.to_numeric(df["cmdCode"], downcast="integer"))
+    return df.astype(dtypes)
+
+
+# Générateur dédié à l'aperçu : tirage de quelques lignes sans permutation de tout l'index
+PREVIEW_RNG = np.random.default_rng(0)
+
+
+def build_exports_preview(df: pd.DataFrame) -> str:
+    # Aperçu sans trier tout le DataFrame : seules les lignes de la 1ère/dernière année sont triées
+    # (Country est catégorielle : tri stable sur les codes entiers)
+    years = df["Year"]
+    first = df[years == years.min()].sort_values("Country", kind="mergesort").head(1)
+    last = df[years == years.max()].sort_values("Country", kind="mergesort").tail(1)
+    n_mid = min(3, max(len(df) - 2, 0))
+    mid = df.iloc[PREVIEW_RNG.choice(len(df), size=n_mid, replace=False)]
+    preview_df = pd.concat([first, mid.sort_values(["Year", "Country"], kind="mergesort"), last])
+    preview_df = preview_df[~preview_df.index.duplicated()][key_columns]
+    return preview_df.to_string(index=False)
+
+
+def log_exports_preview(df: pd.DataFrame) -> None:
+    if df.empty:
+        return
+    # Évaluation paresseuse : l'aperçu n'est construit que si un handler accepte le niveau DEBUG
+    logger.opt(lazy=True).debug(
+        "\nAperçu (trié, 1ère, 3 random, dernière) :\n{}", lambda: build_exports_preview(df)
+    )
+
+
 def get_pipeline_options():
-    import argparse
     parser = argparse.ArgumentParser(description="Exports data pipeline options")
     parser.add_argument("--clear-cache", dest="clear_cache", action="store_true", help="Clear cache before running (force rebuild)")
     parser.add_argument("--fetch-missing", dest="fetch_missing", action="store_true", help="Download missing years from Comtrade API if needed")
@@ -158,93 +318,79 @@ def get_pipeline_options():
 
 
 def collect_exports_data(clear_cache: bool = False) -> dict:
-    cache_file = get_cache_path("exports_combined")
+    # Un Parquet par période (+ ancien cache pickle éventuel, utilisé seulement à défaut de Parquet)
+    legacy_cache = CACHE_DIR / "exports_combined.pkl"
+    cache_files = sorted(CACHE_DIR.glob("exports_combined_*.parquet")) + [legacy_cache]
     # Ne supprime que le cache d'exports, pas tout le dossier
-    if clear_cache and cache_file.exists():
-        cache_file.unlink()
-        logger.info("Cache exports_combined.pkl supprimé avant exécution (option clear_cache)")
-    if not clear_cache and cache_file.exists():
+    if clear_cache:
+        for cache_file in cache_files + [SUMMARY_PATH]:
+            if cache_file.exists():
+                cache_file.unlink()
+                logger.info(f"Cache {cache_file.name} supprimé avant exécution (option clear_cache)")
+    existing_cache = [f for f in cache_files if f.exists() and f != legacy_cache]
+    if not existing_cache and legacy_cache.exists():
+        existing_cache = [legacy_cache]
+    if not clear_cache and existing_cache:
+        # Cache périmé si un CSV d'exports a été modifié après son écriture
+        input_mtime = max((f.stat().st_mtime for f in (DATA_DIR / "exports").glob("*_exports*.csv")), default=0)
+        if min(f.stat().st_mtime for f in existing_cache) < input_mtime:
+            logger.info("Cache exports plus ancien que les CSV sources, reconstruction")
+            existing_cache = []
+    if not clear_cache and existing_cache:
         logger.debug("Cache trouvé, chargement des données d'exportation")
         try:
-            with open(cache_file, "rb") as f:
-                cached_results = pickle.load(f)
-            # Affichage résumé et aperçu pour chaque période du cache
+            cached_results = load_exports_cache(CACHE_DIR)
+            # Affichage résumé (lu depuis le fichier annexe si présent) et aperçu pour chaque période du cache
+            summaries = read_exports_summary()
             for period_name, df in cached_results.items():
-                n_obs = len(df)
-                an_min = df['Year'].min() if 'Year' in df.columns else 'N/A'
-                an_max = df['Year'].max() if 'Year' in df.columns else 'N/A'
-                n_iso = df['ISO'].nunique() if 'ISO' in df.columns else 'N/A'
-                n_prod = df['cmdCode'].nunique() if 'cmdCode' in df.columns else 'N/A'
-                logger.info(
-                    f"\n📊 RÉSUMÉ EXPORTS {period_name}\n"
-                    f"  • 📦 Observations : {n_obs:,}\n"
-                    f"  • 📅 Années       : {an_min}–{an_max}\n"
-                    f"  • 🌍 Pays         : {n_iso}\n"
-                    f"  • 🏷️ Produits     : {n_prod}\n"
-                )
-                df = df.sort_values(["Year", "Country"]).reset_index(drop=True)
-                preview_idx = [0] if len(df) > 0 else []
-                if len(df) > 4:
-                    import numpy as np
-                    random_idx = np.random.choice(range(1, len(df)-1), size=3, replace=False)
-                    preview_idx += list(random_idx)
-                elif len(df) > 1:
-                    preview_idx += list(range(1, len(df)-1))
-                if len(df) > 1:
-                    preview_idx.append(len(df)-1)
-                preview_idx = sorted(set(preview_idx))
-                preview_df = df.iloc[preview_idx][key_columns]
-                logger.debug(f"\nAperçu (trié, 1ère, 3 random, dernière) :\n{preview_df.to_string(index=False)}")
+                summary = summaries.get(period_name)
+                if summary is None:
+                    summary = compute_exports_summary(df)
+                log_exports_summary(period_name, summary)
+                log_exports_preview(df)
             return cached_results
         except Exception as e:
             logger.warning(f"Erreur lecture cache: {e}")
     results = {}
+    summaries = {}
+    if not EXPORT_PERIODS:
+        return results
+    # Les CSV ne sont lus qu'une fois sur l'union des périodes, puis chaque période est découpée par année
+    global_start = min(start for start, _ in EXPORT_PERIODS)
+    global_end = max(end for _, end in EXPORT_PERIODS)
+    all_df = load_exports_from_csv((global_start, global_end))
+    has_data = not all_df.empty
+    if has_data:
+        all_df = validate_exports_data(all_df)
     for period_idx, (start, end) in enumerate(EXPORT_PERIODS):
         period_name = f"{start}_{end}"
         logger.info(f"[1/4] Période {period_name} : collecte des exports...")
-        df = load_exports_from_csv((start, end))
-        if df.empty:
+        if not has_data:
             logger.warning(f"Aucune donnée d'exports pour {period_name}")
             continue
-        df = validate_exports_data(df)
-        if df.empty:
+        if all_df.empty:
             logger.warning(f"Données exports invalides pour {period_name}")
             continue
+        df = all_df[all_df["Year"].between(start, end)]
+        if df.empty:
+            logger.warning(f"Aucune donnée d'exports pour {period_name}")
+            continue
+        df = downcast_exports(df)
         # Regroupement des infos principales en un seul logger
-        n_obs = len(df)
-        an_min = df['Year'].min() if 'Year' in df.columns else 'N/A'
-        an_max = df['Year'].max() if 'Year' in df.columns else 'N/A'
-        n_iso = df['ISO'].nunique() if 'ISO' in df.columns else 'N/A'
-        n_prod = df['cmdCode'].nunique() if 'cmdCode' in df.columns else 'N/A'
-        # Logger résumé façon tableau avec smileys
-        logger.info(
-            f"\n📊 RÉSUMÉ EXPORTS {start}-{end}\n"
-            f"  • 📦 Observations : {n_obs:,}\n"
-            f"  • 📅 Années       : {an_min}–{an_max}\n"
-            f"  • 🌍 Pays         : {n_iso}\n"
-            f"  • 🏷️ Produits     : {n_prod}\n"
-        )
-        # Tri par Year puis Country
-        df = df.sort_values(["Year", "Country"]).reset_index(drop=True)
+        summaries[period_name] = compute_exports_summary(df)
+        log_exports_summary(f"{start}-{end}", summaries[period_name])
         # Aperçu lisible : 1ère ligne, 3 random, dernière (colonnes clés)
-        preview_idx = [0] if len(df) > 0 else []
-        if len(df) > 4:
-            import numpy as np
-            random_idx = np.random.choice(range(1, len(df)-1), size=3, replace=False)
-            preview_idx += list(random_idx)
-        elif len(df) > 1:
-            preview_idx += list(range(1, len(df)-1))
-        if len(df) > 1:
-            preview_idx.append(len(df)-1)
-        preview_idx = sorted(set(preview_idx))
-        preview_df = df.iloc[preview_idx][key_columns]
-        logger.debug(f"\nAperçu (trié, 1ère, 3 random, dernière) :\n{preview_df.to_string(index=False)}")
+        log_exports_preview(df)
         results[period_name] = df
     if results:
         logger.info("Sauvegarde cache des données d'exportation")
         try:
-            with open(cache_file, "wb") as f:
-                pickle.dump(results, f)
+            save_exports_cache(results, CACHE_DIR)
+            write_exports_summary(summaries)
+            # Les caches Parquet remplacent l'ancien pickle : il ne doit plus fausser le test de fraîcheur
+            if legacy_cache.exists():
+                legacy_cache.unlink()
+                logger.debug(f"Ancien cache {legacy_cache.name} supprimé (remplacé par les caches Parquet)")
         except Exception as e:
             logger.warning(f"Erreur sauvegarde cache: {e}")
     logger.info("✅ Collecte des données d'exportation terminée")
@@ -256,7 +402,6 @@ if __name__ == "__main__":
     logger.remove()
     logger.add(sys.stderr, level="DEBUG")
     clear_cache, fetch_missing = get_pipeline_options()
-    from utils.utils import fetch_comtrade_exports
     exports_dir = DATA_DIR / "exports"
     exports_dir.mkdir(parents=True, exist_ok=True)
     for (start, end) in EXPORT_PERIODS:
@@ -274,7 +419,7 @@ if __name__ == "__main__":
         if not df.empty:
             any_success = True
     if any_success:
-        logger.info(f"✅ Données exports sauvegardées dans le cache fichier '{get_cache_path('exports_combined')}'.\n")
+        logger.info(f"✅ Données exports sauvegardées dans le cache fichier '{get_cache_path('*')}'.\n")
     else:
         logger.error("❌ Aucune période n'a pu être traitée correctement.\n")
         sys.exit(1)
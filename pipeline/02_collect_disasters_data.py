@@ -11,7 +11,17 @@ import pandas as pd
 import numpy as np
 from loguru import logger
 import json
-from utils.utils import clean_iso_codes
+import re
+import warnings
+from utils.utils import (
+    clean_iso_codes,
+    load_exports_cache,
+    get_disasters_cache_path,
+    save_disasters_cache,
+    load_disasters_cache,
+    read_excel_cached,
+    read_stata_cached,
+)
 
 # Load config from config.json
 CONFIG_PATH = Path(__file__).parent / "config.json"
@@ -23,7 +33,11 @@ DATA_DIR = Path(config["DATA_DIR"])
 LOG_LEVEL = config["LOG_LEVEL"]
 EXCLUDED_ISO_CODES = config["EXCLUDED_ISO_CODES"]
 DISASTER_TYPES = config["DISASTER_TYPES"]
+# Préfixes de colonnes par type ("Extreme temperature" -> "extreme_temperature"), calculés une fois
+DISASTER_DTYPE_KEYS = [dtype.lower().replace(" ", "_") for dtype in DISASTER_TYPES]
 EXPORT_PERIODS = [tuple(period) for period in config["EXPORT_PERIODS"]]
+# Lecture de l'ancien cache pickle si le Parquet est absent (transition, à retirer à terme)
+LEGACY_PICKLE_CACHE = config.get("LEGACY_PICKLE_CACHE", True)
 
 # Configure logging
 logger.remove()
@@ -60,8 +74,7 @@ def preview_dataframe(df, key_columns=None, n_random=3):
     ]
     # Dynamically build disaster_cols from DISASTER_TYPES in config
     disaster_cols = []
-    for dtype in DISASTER_TYPES:
-        base = dtype.lower().replace(" ", "_")
+    for base in DISASTER_DTYPE_KEYS:
         for suffix in ["deaths", "affected", "events"]:
             colname = f"{base}_{suffix}"
             if colname in df.columns:
@@ -73,18 +86,32 @@ def preview_dataframe(df, key_columns=None, n_random=3):
     preview_cols = default_cols + disaster_cols
     if not preview_cols:
         preview_cols = df.columns[:min(5, len(df.columns))].tolist()
-    df = df.sort_values([c for c in ["Year", "Country"] if c in df.columns]).reset_index(drop=True)
-    preview_idx = [0] if len(df) > 0 else []
-    if len(df) > 4:
-        random_idx = np.random.choice(range(1, len(df)-1), size=min(n_random, len(df)-2), replace=False)
-        preview_idx += list(random_idx)
-    elif len(df) > 1:
-        preview_idx += list(range(1, len(df)-1))
-    if len(df) > 1:
-        preview_idx.append(len(df)-1)
-    preview_idx = sorted(set(preview_idx))
-    preview_df = df.iloc[preview_idx][preview_cols] if preview_cols else df.iloc[preview_idx]
-    logger.trace(f"\nPreview (sorted, first, {n_random} random, last):\n{preview_df.to_string(index=False)}")
+    # Pas de tri complet du panel : seules les lignes de la 1ère/dernière année sont triées
+    sort_keys = [c for c in ["Year", "Country"] if c in df.columns]
+    if "Year" in df.columns:
+        years = df["Year"]
+        first = df[years == years.min()].sort_values(sort_keys, kind="mergesort").head(1)
+        last = df[years == years.max()].sort_values(sort_keys, kind="mergesort").tail(1)
+    else:
+        first, last = df.head(1), df.tail(1)
+    n_mid = min(n_random, max(len(df) - 2, 0))
+    mid = df.sample(n=n_mid, random_state=0).sort_values(sort_keys, kind="mergesort")
+    preview_df = pd.concat([first, mid, last])
+    preview_df = preview_df[~preview_df.index.duplicated()][preview_cols]
+    logger.opt(lazy=True).trace(
+        "\nPreview (sorted, first, {} random, last):\n{}", lambda: n_random, lambda: preview_df.to_string(index=False)
+    )
+
+# Colonnes texte répétitives, encodées en catégories dès le chargement (codes entiers pour merges/groupby)
+CATEGORY_COLUMNS = ["ISO", "Country", "Disaster Type"]
+
+
+def to_categories(df: pd.DataFrame) -> pd.DataFrame:
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
 
 def load_emdat_data(year_start: int, year_end: int) -> pd.DataFrame:
     """
@@ -106,7 +133,7 @@ def load_emdat_data(year_start: int, year_end: int) -> pd.DataFrame:
             if not emdat_file.exists():
                 logger.error(f"EM-DAT file not found: {emdat_file}")
                 return pd.DataFrame()
-            df = pd.read_excel(emdat_file, sheet_name="EM-DAT Data")
+            df = read_excel_cached(emdat_file, CACHE_DIR, sheet_name="EM-DAT Data")
             logger.debug("[EM-DAT] Lecture de la feuille 'EM-DAT Data'")
         else:
             emdat_file = EMDAT_DIR / "EM-DAT countries 2000+.xlsx"
@@ -114,7 +141,7 @@ def load_emdat_data(year_start: int, year_end: int) -> pd.DataFrame:
             if not emdat_file.exists():
                 logger.error(f"EM-DAT file not found: {emdat_file}")
                 return pd.DataFrame()
-            df = pd.read_excel(emdat_file, skiprows=[1])
+            df = read_excel_cached(emdat_file, CACHE_DIR, skiprows=[1])
             logger.debug("[EM-DAT] Lecture avec skiprows=[1]")
         logger.info(f"[EM-DAT] {len(df):,} lignes chargées depuis {emdat_file.name}")
         logger.trace(f"[EM-DAT] Colonnes disponibles : {list(df.columns)}")
@@ -142,12 +169,26 @@ def load_emdat_data(year_start: int, year_end: int) -> pd.DataFrame:
         # After loading, normalize ISO codes
         if not df.empty and "ISO" in df.columns:
             df = clean_iso_codes(df, iso_col="ISO")
-        return df
+        return to_categories(df)
     except Exception as e:
         logger.error(f"[EM-DAT] Erreur lors du chargement : {e}")
         return pd.DataFrame()
 
 
+# Mapping from disaster type to GeoMet variable suffix
+GEOMET_TYPE_SUFFIXES = {
+    'Earthquake': 'eq',
+    'Flood': 'fld',
+    'Storm': 'str',
+    'Extreme temperature': 'temp',
+}
+# GeoMet columns kept: keys, every intensity proxy (*_pop_*, damage_gdp_*, all hazards
+# including e.g. affected_pop_vol) and anything the downstream disaster filters match
+GEOMET_COLUMN_RE = re.compile(
+    r"^(?:iso|year)$|_pop_|^damage_gdp_|deaths|affected|events|intensity|index"
+)
+
+
 def load_geomet_data(year_start: int, year_end: int) -> pd.DataFrame:
     """
     Load GeoMet data for the specified period.
@@ -164,8 +205,8 @@ def load_geomet_data(year_start: int, year_end: int) -> pd.DataFrame:
     geomet_file = GEOMET_DIR / "IfoGAME_EMDAT.dta"
 
     try:
-        # Use Stata reader as in view_raw_data.py
-        df = pd.read_stata(geomet_file)
+        # Use Stata reader as in view_raw_data.py (once, via a Parquet copy): only ISO, year and disaster columns
+        df = read_stata_cached(geomet_file, CACHE_DIR, columns=GEOMET_COLUMN_RE.search)
         logger.info(f"Loaded GeoMet data: {len(df):,} records")
 
         # Filter by year range
@@ -186,7 +227,7 @@ def load_geomet_data(year_start: int, year_end: int) -> pd.DataFrame:
         if not df.empty and "ISO" in df.columns:
             df = clean_iso_codes(df, iso_col="ISO")
 
-        return df
+        return to_categories(df)
 
     except Exception as e:
         logger.error(f"Failed to load GeoMet data: {e}")
@@ -196,16 +237,9 @@ def load_geomet_data(year_start: int, year_end: int) -> pd.DataFrame:
 def aggregate_geomet_intensity(geomet_df):
     if geomet_df.empty:
         return geomet_df
-    # Mapping from disaster type to GeoMet variable suffix
-    type_suffixes = {
-        'Earthquake': 'eq',
-        'Flood': 'fld',
-        'Storm': 'str',
-        'Extreme temperature': 'temp',
-    }
-    # For each disaster type, aggregate proxies
-    agg_frames = []
-    for dtype, suffix in type_suffixes.items():
+    # For each disaster type, sum proxies into an intensity column (row-wise, vectorized)
+    intensity_cols = []
+    for dtype, suffix in GEOMET_TYPE_SUFFIXES.items():
         # Find all relevant columns for this type
         proxies = [
             f'killed_pop_{suffix}',
@@ -215,20 +249,15 @@ def aggregate_geomet_intensity(geomet_df):
         cols_present = [c for c in proxies if c in geomet_df.columns]
         if not cols_present:
             continue
-        # Sum across all proxies for intensity
-        geomet_df[f'{dtype.lower().replace(" ", "_")}_intensity'] = geomet_df[cols_present].sum(axis=1, skipna=True)
-        # Aggregate by ISO, Year
-        agg = geomet_df.groupby(['ISO', 'Year'])[f'{dtype.lower().replace(" ", "_")}_intensity'].sum().reset_index()
-        agg_frames.append(agg)
-    # Merge all *_intensity columns into a single DataFrame
-    if not agg_frames:
+        intensity_col = f'{dtype.lower().replace(" ", "_")}_intensity'
+        geomet_df[intensity_col] = geomet_df[cols_present].sum(axis=1, skipna=True)
+        intensity_cols.append(intensity_col)
+    if not intensity_cols:
         return geomet_df
-    intensity_df = agg_frames[0]
-    for frame in agg_frames[1:]:
-        intensity_df = intensity_df.merge(frame, on=['ISO', 'Year'], how='outer')
-    # Merge back into original GeoMet (on ISO, Year)
+    # Aggregate all intensity columns by ISO, Year in one groupby, joined back onto GeoMet in one pass
+    agg = geomet_df.groupby(['ISO', 'Year'], sort=False, observed=True)[intensity_cols].sum()
     geomet_df = geomet_df.drop(columns=[c for c in geomet_df.columns if c.endswith('_intensity')], errors='ignore')
-    geomet_df = geomet_df.merge(intensity_df, on=['ISO', 'Year'], how='left')
+    geomet_df = geomet_df.join(agg, on=['ISO', 'Year'])
     return geomet_df
 
 
@@ -244,7 +273,7 @@ def load_income_and_population() -> pd.DataFrame:
     try:
         # Load income classification
         income_file = WORLDBANK_DIR / "country_income_classification.xlsx"
-        df_income = pd.read_excel(income_file)
+        df_income = read_excel_cached(income_file, CACHE_DIR, columns=["Code", "Income group"])
         df_income = df_income.rename(columns={"Code": "ISO"})
         df_income["is_poor_country"] = df_income["Income group"].isin([
             "Low income", "Lower middle income"
@@ -253,7 +282,18 @@ def load_income_and_population() -> pd.DataFrame:
 
         # Load population data (explicit mapping)
         pop_file = UNDESA_DIR / "total_population.xlsx"
-        df_pop = pd.read_excel(pop_file, sheet_name="Estimates", header=16)
+        df_pop = read_excel_cached(
+            pop_file,
+            CACHE_DIR,
+            columns=[
+                "Type",
+                "ISO3 Alpha-code",
+                "Total Population, as of 1 January (thousands)",
+                "Year",
+            ],
+            sheet_name="Estimates",
+            header=16,
+        )
         df_pop = df_pop.rename(
             columns={
                 "Region, subregion, country or area *": "Country",
@@ -279,7 +319,7 @@ def load_income_and_population() -> pd.DataFrame:
         logger.info(f"Loaded World Bank data: {len(df_income)} countries (income), {len(df_pop)} country-years (population)")
         # Filtrer les ISO exclus dans le DataFrame final (après merge)
         df = df[~df["ISO"].isin(EXCLUDED_ISO_CODES)]
-        return df
+        return to_categories(df)
 
     except Exception as e:
         logger.error(f"Failed to load World Bank data: {e}")
@@ -356,61 +396,90 @@ def process_emdat_disasters(df: pd.DataFrame) -> pd.DataFrame:
     df["Disaster Type"] = df["Disaster Type"].map(disaster_mapping).fillna("Other")
     logger.info(f"Filtered to {len(df):,} records for disaster types of interest")
 
-    # Create aggregated variables by country-year-type
-    disaster_vars = []
-
-    for disaster_type in DISASTER_TYPES:
-        type_df = df[df["Disaster Type"] == disaster_type].copy()
-
-        # Aggregate by country-year
-        agg_df = (
-            type_df.groupby(["ISO", "Country", "Year"])
-            .agg(
-                {
-                    "Total Deaths": "sum",
-                    "Total Affected": "sum",
-                    "Disaster Type": "count",  # Number of events
-                }
-            )
-            .reset_index()
-        )
+    if not DISASTER_TYPES:
+        logger.warning("No disaster data to process")
+        return pd.DataFrame()
 
-        # Rename columns
-        disaster_name = disaster_type.lower().replace(" ", "_")
-        agg_df = agg_df.rename(
-            columns={
-                "Total Deaths": f"{disaster_name}_deaths",
-                "Total Affected": f"{disaster_name}_affected",
-                "Disaster Type": f"{disaster_name}_events",
-            }
+    # Create aggregated variables by country-year-type: one groupby, pivoted to one column per type and metric
+    df["Disaster Type"] = pd.Categorical(df["Disaster Type"], categories=DISASTER_TYPES)
+    agg_df = (
+        df.groupby(["ISO", "Country", "Year", "Disaster Type"], observed=True)
+        .agg(
+            deaths=("Total Deaths", "sum"),
+            affected=("Total Affected", "sum"),
+            events=("Total Deaths", "size"),  # Number of events
         )
+        .unstack("Disaster Type", fill_value=0)
+    )
+    # Same column order as before: deaths, affected, events for each type (types without events filled with 0)
+    metrics = [(metric, disaster_type) for disaster_type in DISASTER_TYPES for metric in ("deaths", "affected", "events")]
+    agg_df = agg_df.reindex(columns=pd.MultiIndex.from_tuples(metrics), fill_value=0)
+    agg_df.columns = [f"{base}_{metric}" for base in DISASTER_DTYPE_KEYS for metric in ("deaths", "affected", "events")]
+    result = agg_df.reset_index()
+    disaster_cols = list(agg_df.columns)
 
-        disaster_vars.append(agg_df)
+    logger.info(
+        f"Processed EM-DAT data: {len(result):,} country-year observations"
+    )
+    logger.trace(f"Created variables: {disaster_cols}")
 
-    # Merge all disaster variables
-    if disaster_vars:
-        result = disaster_vars[0]
-        for var_df in disaster_vars[1:]:
-            result = result.merge(var_df, on=["ISO", "Country", "Year"], how="outer")
+    return result
 
-        # Fill missing values with 0
-        disaster_cols = [
-            col
-            for col in result.columns
-            if any(d in col for d in ["deaths", "affected", "events"])
-        ]
-        result[disaster_cols] = result[disaster_cols].fillna(0)
 
-        logger.info(
-            f"Processed EM-DAT data: {len(result):,} country-year observations"
-        )
-        logger.trace(f"Created variables: {disaster_cols}")
+def yearly_quantile_thresholds(years, values: np.ndarray, quantiles) -> np.ndarray:
+    """
+    Per-year NaN-ignoring quantiles of several columns at once, broadcast back to rows.
 
-        return result
+    Rows are sorted by year once; each year is a contiguous slice (offsets) whose
+    quantiles are computed for all columns in a single np.nanquantile call.
+    Columns that are only zeros/NaN in a year are skipped: their threshold is left
+    NaN, which flags nothing, exactly like a 0 threshold on zero values would.
+    Returns an array of shape (len(quantiles), n_rows, n_cols); all-NaN years give NaN.
+    """
+    year_codes, year_values = pd.factorize(years, sort=True)
+    thresholds = np.full((len(quantiles), len(year_values), values.shape[1]), np.nan)
+    if len(year_values) == 0:
+        return thresholds[:, year_codes, :]
+    order = np.argsort(year_codes, kind="stable")
+    sorted_values = values[order]
+    offsets = np.searchsorted(year_codes[order], np.arange(len(year_values) + 1))
+    # (année, colonne) avec au moins une valeur non nulle : une seule réduction NumPy
+    active = np.logical_or.reduceat(np.abs(sorted_values) > 0, offsets[:-1], axis=0)
+    with warnings.catch_warnings():
+        # Années sans valeur valide : seuil NaN, sans avertissement numpy
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for g in range(len(year_values)):
+            cols = np.flatnonzero(active[g])
+            if cols.size == 0:
+                continue
+            block = sorted_values[offsets[g]:offsets[g + 1], cols]
+            thresholds[:, g, cols] = np.nanquantile(block, quantiles, axis=0)
+    return thresholds[:, year_codes, :]
+
+
+# Bits réservés à l'année dans les clés (ISO, Year) codées en int64
+ISO_YEAR_BITS = 20
+
+# Filtres de colonnes compilés une fois : variables de désastre (sous-chaîne,
+# inclut affected_pop_*) et indicateurs d'événements significatifs (suffixe)
+DISASTER_COL_RE = re.compile(r"deaths|affected|events|intensity|index")
+SIG_SUFFIX_RE = re.compile(r"_(?:sig_median|sig_p90|sig_abs1000|sig_anydeaths|geomet_sig_p90)$")
+
+
+def iso_year_keys(df: pd.DataFrame, iso_index: pd.Index) -> np.ndarray:
+    """
+    Row-wise (ISO, Year) keys of df packed as int64: ISO code << ISO_YEAR_BITS | Year.
+    Year must not be missing; ISO values absent from iso_index get a negative key.
+    """
+    codes = iso_index.get_indexer(df["ISO"].astype(str)).astype(np.int64)
+    return (codes << ISO_YEAR_BITS) | df["Year"].to_numpy(dtype=np.int64)
 
-    else:
-        logger.warning("No disaster data to process")
-        return pd.DataFrame()
+
+def pack_iso_year(df: pd.DataFrame, iso_index: pd.Index) -> np.ndarray:
+    """
+    Unique (ISO, Year) pairs of df packed as int64 keys (see iso_year_keys).
+    """
+    return np.unique(iso_year_keys(df[df["Year"].notna()], iso_index))
 
 
 def create_disaster_dataset(
@@ -419,20 +488,23 @@ def create_disaster_dataset(
     """
     Create the complete disaster dataset by combining EM-DAT and GeoMet.
     """
-    cache_file = CACHE_DIR / f"disasters_combined_{year_start}_{year_end}.pkl"
-
-    # Cache management (clear) : ne supprime que le cache de la période concernée
-    if clear_cache and cache_file.exists():
-        cache_file.unlink()
-        logger.info(f"Cache deleted: {cache_file}")
+    cache_file = get_disasters_cache_path(CACHE_DIR, year_start, year_end)
+    legacy_cache_file = get_disasters_cache_path(CACHE_DIR, year_start, year_end, legacy=True)
+
+    # Cache management (clear) : ne supprime que le cache de la période concernée (Parquet et ancien pickle)
+    if clear_cache and (cache_file.exists() or legacy_cache_file.exists()):
+        for f in (cache_file, legacy_cache_file):
+            if f.exists():
+                f.unlink()
+                logger.info(f"Cache deleted: {f}")
     elif clear_cache:
         logger.info(f"Option CLEAR_CACHE activée mais aucun cache à supprimer: {cache_file} n'existe pas")
 
     # Always use cache if present (unless clear_cache)
-    if not clear_cache and cache_file.exists():
+    if not clear_cache and (cache_file.exists() or (LEGACY_PICKLE_CACHE and legacy_cache_file.exists())):
         logger.info(f"Loading disasters from cache: {cache_file}")
         try:
-            df = pd.read_pickle(cache_file)
+            df = load_disasters_cache(CACHE_DIR, year_start, year_end, legacy_pickle=LEGACY_PICKLE_CACHE)
             logger.info(f"{len(df):,} observations loaded from cache")
             # Summary and preview
             n_obs = len(df)
@@ -479,40 +551,42 @@ def create_disaster_dataset(
         logger.error("No disaster data available")
         return pd.DataFrame()
 
-    # Create full country-year panel
-    countries = combined_df["ISO"].unique()
-    years = range(year_start, year_end + 1)
-    full_panel = pd.MultiIndex.from_product(
-        [countries, years], names=["ISO", "Year"]
-    ).to_frame(index=False)
-    result = full_panel.merge(combined_df, on=["ISO", "Year"], how="left")
-
     # --- PANEL RESTRICTION: Only keep (ISO, Year) present in EM-DAT, GeoMet, or Exports, and present in World Bank population ---
-    # Get valid (ISO, Year) from EM-DAT and GeoMet
-    valid_iso_year = set()
-    if not emdat_processed.empty:
-        valid_iso_year.update(set(emdat_processed[["ISO", "Year"]].drop_duplicates().itertuples(index=False, name=None)))
-    if not geomet_df.empty:
-        valid_iso_year.update(set(geomet_df[["ISO", "Year"]].drop_duplicates().itertuples(index=False, name=None)))
+    # Get (ISO, Year) pairs from EM-DAT and GeoMet
+    iso_year_sources = [df[["ISO", "Year"]] for df in (emdat_processed, geomet_df) if not df.empty]
     # Optionally: add exports (step 1) if available in cache
-    exports_cache_file = CACHE_DIR / "exports_combined.pkl"
-    if exports_cache_file.exists():
-        try:
-            exports_data = pd.read_pickle(exports_cache_file)
-            for period_key, df_exp in exports_data.items():
-                if isinstance(df_exp, pd.DataFrame):
-                    valid_iso_year.update(set(df_exp[["ISO", "Year"]].drop_duplicates().itertuples(index=False, name=None)))
-        except Exception as e:
-            logger.warning(f"Could not load exports for panel restriction: {e}")
+    try:
+        exports_data = load_exports_cache(CACHE_DIR, columns=["ISO", "Year"])
+        for period_key, df_exp in exports_data.items():
+            if isinstance(df_exp, pd.DataFrame):
+                iso_year_sources.append(df_exp[["ISO", "Year"]])
+    except Exception as e:
+        logger.warning(f"Could not load exports for panel restriction: {e}")
+    wb_iso_year = worldbank_df[["ISO", "Year"]] if not worldbank_df.empty else None
+    # Paires (ISO, Year) codées en un entier int64 (code ISO commun << ISO_YEAR_BITS | Year) : union/intersection NumPy
+    all_iso = [df["ISO"].astype(str).to_numpy() for df in iso_year_sources]
+    if wb_iso_year is not None:
+        all_iso.append(wb_iso_year["ISO"].astype(str).to_numpy())
+    iso_index = pd.Index(np.unique(np.concatenate(all_iso))) if all_iso else pd.Index([], dtype=str)
+    valid_keys = np.array([], dtype=np.int64)
+    for df in iso_year_sources:
+        valid_keys = np.union1d(valid_keys, pack_iso_year(df, iso_index))
     # Restrict to (ISO, Year) present in World Bank population
-    if not worldbank_df.empty:
-        wb_iso_year = set(worldbank_df[["ISO", "Year"]].drop_duplicates().itertuples(index=False, name=None))
-        valid_iso_year = valid_iso_year & wb_iso_year
-    # Build panel only for valid (ISO, Year)
-    panel_df = pd.DataFrame(list(valid_iso_year), columns=["ISO", "Year"])
-    # --- Make combined_df unique on (ISO, Year) ---
-    combined_df_unique = combined_df.drop_duplicates(subset=["ISO", "Year"])
-    result = panel_df.merge(combined_df_unique, on=["ISO", "Year"], how="left")
+    if wb_iso_year is not None:
+        valid_keys = np.intersect1d(valid_keys, pack_iso_year(wb_iso_year, iso_index), assume_unique=True)
+    # Build panel only for valid (ISO, Year), sorted by ISO then Year
+    panel_df = pd.DataFrame({
+        "ISO": np.asarray(iso_index[valid_keys >> ISO_YEAR_BITS]),
+        "Year": valid_keys & ((1 << ISO_YEAR_BITS) - 1),
+    })
+    # --- Make combined_df unique on (ISO, Year) and align it on the panel ---
+    # Première ligne par clé (comme drop_duplicates), puis reindex sur les clés triées du panel (équivaut au merge left)
+    combined_df = combined_df[combined_df["Year"].notna()]
+    combined_keys, first_rows = np.unique(iso_year_keys(combined_df, iso_index), return_index=True)
+    combined_values = combined_df.drop(columns=["ISO", "Year"]).iloc[first_rows].set_axis(combined_keys)
+    result = pd.concat(
+        [panel_df, combined_values.reindex(valid_keys).reset_index(drop=True)], axis=1
+    )
 
     # Fill missing country info (use first non-null value per ISO)
     country_info_cols = ["ISO", "Country"]
@@ -523,10 +597,16 @@ def create_disaster_dataset(
         result = result.drop(columns=["Country_y"])
 
     # Fill disaster variables with 0
-    disaster_cols = [
-        col for col in result.columns if any(term in col for term in ["deaths", "affected", "events", "intensity", "index"])
-    ]
+    disaster_cols = [col for col in result.columns if DISASTER_COL_RE.search(col)]
     result[disaster_cols] = result[disaster_cols].fillna(0)
+    # Compteurs EM-DAT (morts, affectés, nombre d'événements) en int32 s'ils sont entiers et tiennent sur 32 bits
+    for col in [f"{base}_{kind}" for base in DISASTER_DTYPE_KEYS for kind in ("deaths", "affected", "events")]:
+        if col in result.columns:
+            values = result[col].to_numpy(dtype=float)
+            if (values % 1 == 0).all() and np.abs(values).max(initial=0) < np.iinfo(np.int32).max:
+                result[col] = values.astype(np.int32)
+            else:
+                logger.debug(f"{col} conservée en float64 (valeurs non entières ou hors int32)")
 
     # Merge population and income (World Bank) on ISO, Year (une seule fois, toutes les colonnes)
     if not worldbank_df.empty:
@@ -534,7 +614,7 @@ def create_disaster_dataset(
         worldbank_df = worldbank_df[pop_cols]
         # Ajout du booléen is_small_country par année selon le seuil du config
         if "Population" in worldbank_df.columns:
-            worldbank_df["is_small_country"] = (worldbank_df["Population"] < config["SMALL_COUNTRY_THRESHOLD"]).astype(int)
+            worldbank_df["is_small_country"] = (worldbank_df["Population"].to_numpy() < config["SMALL_COUNTRY_THRESHOLD"]).astype(np.int8)
         result = result.merge(worldbank_df, on=["ISO", "Year"], how="left")
         logger.info("Added World Bank population and income data (ISO, Year) + is_small_country")
 
@@ -543,84 +623,53 @@ def create_disaster_dataset(
         result["Population"] = result["Population"].fillna(0)
 
     # --- SIGNIFICANT EVENT FLAGS ---
-    # For each disaster type, create several boolean flags for significant events (EM-DAT)
-    for dtype in DISASTER_TYPES:
-        base = dtype.lower().replace(" ", "_")
-        deaths_col = f"{base}_deaths"
-        flag_median = []
-        flag_p90 = []
-        flag_abs = []
-        flag_any = []
-        for year, group in result.groupby("Year"):
-            pop = group["Population"].replace(0, np.nan)
-            ratio = group[deaths_col] / pop
-            # Correction: éviter les warnings numpy sur les slices vides
-            if ratio.notna().any():
-                median = ratio.median(skipna=True)
-                p90 = ratio.quantile(0.9)
-            else:
-                median = 0
-                p90 = 0
-            flag_median.extend((ratio > median).astype(int))
-            flag_p90.extend((ratio > p90).astype(int))
-            flag_abs.extend((group[deaths_col] > 1000).astype(int))
-            flag_any.extend((group[deaths_col] > 0).astype(int))
-        result[f"{base}_sig_median"] = flag_median
-        result[f"{base}_sig_p90"] = flag_p90
-        result[f"{base}_sig_abs1000"] = flag_abs
-        result[f"{base}_sig_anydeaths"] = flag_any
-
-    # --- SIGNIFICANT EVENT FLAGS FOR GEOMET (if intensity columns exist) ---
-    for dtype in DISASTER_TYPES:
-        base = dtype.lower().replace(" ", "_")
-        intensity_col = f"{base}_intensity"
-        if intensity_col in result.columns:
-            flag_p90 = []
-            for year, group in result.groupby("Year"):
-                p90 = group[intensity_col].quantile(0.9)
-                flag_p90.extend((group[intensity_col] > p90).astype(int))
-            result[f"{base}_geomet_sig_p90"] = flag_p90
-
-    # --- EXTREME EVENT INDICATORS ---
-    # For each disaster type, create extreme_*_emdat and extreme_*_geomet columns
-    for dtype in DISASTER_TYPES:
-        base = dtype.lower().replace(" ", "_")
-        # EM-DAT: extreme if sig_p90
-        sig_p90_col = f"{base}_sig_p90"
-        extreme_emdat_col = f"extreme_{base}_emdat"
-        if sig_p90_col in result.columns:
-            result[extreme_emdat_col] = result[sig_p90_col]
-        # GeoMet: extreme if geomet_sig_p90
-        geomet_sig_p90_col = f"{base}_geomet_sig_p90"
-        extreme_geomet_col = f"extreme_{base}_geomet"
-        if geomet_sig_p90_col in result.columns:
-            result[extreme_geomet_col] = result[geomet_sig_p90_col]
-
-    sig_cols = [col for col in result.columns if any(
-        col.endswith(suffix) for suffix in ["_sig_median", "_sig_p90", "_sig_abs1000", "_sig_anydeaths", "_geomet_sig_p90"]
-    )]
-    sig_summary = {col: int(result[col].sum()) for col in sig_cols}
-    if sig_summary:
-        logger.info("\nRésumé des événements significatifs (nombre d'années/pays avec événement):")
-        for col, count in sig_summary.items():
-            logger.info(f"  {col}: {count}")
-    else:
-        logger.info("Aucun indicateur d'événement significatif trouvé dans le panel.")
+    # For each disaster type, create several boolean flags for significant events (EM-DAT),
+    # and p90 flags on GeoMet intensities when available. Ratios morts/population et intensités
+    # sont empilés en une matrice : seuils annuels (médiane, p90) calculés en une passe pour tous les types
+    bases = DISASTER_DTYPE_KEYS
+    geomet_bases = [base for base in bases if f"{base}_intensity" in result.columns]
+    pop = result["Population"].to_numpy(dtype=float)[:, None]
+    deaths = np.column_stack([result[f"{base}_deaths"].to_numpy(dtype=float) for base in bases])
+    intensities = [result[f"{base}_intensity"].to_numpy(dtype=float) for base in geomet_bases]
+    # Ratio morts/population écrit directement dans la matrice ; population nulle : ratio NaN (sans copie ni warning)
+    values = np.full((len(result), len(bases) + len(geomet_bases)), np.nan)
+    np.divide(deaths, pop, out=values[:, :len(bases)], where=pop != 0)
+    if geomet_bases:
+        values[:, len(bases):] = np.column_stack(intensities)
+    median, p90 = yearly_quantile_thresholds(result["Year"], values, [0.5, 0.9])
+    # Comparaisons à un seuil NaN (année sans ratio valide) : aucun flag
+    above_median = values > median
+    above_p90 = values > p90
+    for i, base in enumerate(bases):
+        result[f"{base}_sig_median"] = above_median[:, i].astype(np.int8)
+        result[f"{base}_sig_p90"] = above_p90[:, i].astype(np.int8)
+        result[f"{base}_sig_abs1000"] = (deaths[:, i] > 1000).astype(np.int8)
+        result[f"{base}_sig_anydeaths"] = (deaths[:, i] > 0).astype(np.int8)
+    for j, base in enumerate(geomet_bases, start=len(bases)):
+        result[f"{base}_geomet_sig_p90"] = above_p90[:, j].astype(np.int8)
 
     # --- EXTREME EVENT INDICATORS (for R tables 5/6) ---
-    # Pour chaque type, 1 si sig_p90==1, 0 sinon
-    for dtype in DISASTER_TYPES:
-        base = dtype.lower().replace(" ", "_")
+    # For each disaster type, extreme_*_emdat / extreme_*_geomet = 1 si sig_p90==1, 0 sinon
+    for base in DISASTER_DTYPE_KEYS:
         # EM-DAT extrêmes (top 10% morts/pop)
         sig_col = f"{base}_sig_p90"
         extreme_col = f"extreme_{base}_emdat"
         if sig_col in result.columns:
-            result[extreme_col] = (result[sig_col] == 1).astype(int)
+            result[extreme_col] = (result[sig_col] == 1).astype(np.int8)
         # GeoMet extrêmes (top 10% intensité)
         geomet_sig_col = f"{base}_geomet_sig_p90"
         extreme_geomet_col = f"extreme_{base}_geomet"
         if geomet_sig_col in result.columns:
-            result[extreme_geomet_col] = (result[geomet_sig_col] == 1).astype(int)
+            result[extreme_geomet_col] = (result[geomet_sig_col] == 1).astype(np.int8)
+
+    sig_cols = [col for col in result.columns if SIG_SUFFIX_RE.search(col)]
+    sig_summary = {col: int(result[col].sum()) for col in sig_cols}
+    if sig_summary:
+        logger.info("\nRésumé des événements significatifs (nombre d'années/pays avec événement):")
+        for col, count in sig_summary.items():
+            logger.info(f"  {col}: {count}")
+    else:
+        logger.info("Aucun indicateur d'événement significatif trouvé dans le panel.")
 
     # Harmonisation stricte des colonnes World Bank (pas de if, on force les bons noms partout)
     # Population, is_poor_country, is_small_country, Income group
@@ -644,31 +693,23 @@ def create_disaster_dataset(
         logger.warning(f"{len(missing_iso)} ISO sans Income group dans World Bank : {sorted(missing_iso)} (valeurs NA imputées)")
         result['Income group'] = result['Income group'].fillna('NA')
     # Typage strict (sans fillna)
-    result['is_poor_country'] = result['is_poor_country'].astype(int)
-    result['is_small_country'] = result['is_small_country'].astype(int)
+    # Flags 0/1 en int8 (le merge left peut les avoir élargis en float/objet ; plus de valeur manquante ici)
+    result['is_poor_country'] = result['is_poor_country'].astype(np.int8)
+    result['is_small_country'] = result['is_small_country'].astype(np.int8)
     result['Population'] = result['Population'].astype(float)
     result['Income group'] = result['Income group'].astype(str)
     logger.trace(f"Colonnes World Bank dans le dataset final: {[c for c in result.columns if 'poor' in c or 'small' in c or 'Income group' in c or 'Population' in c]}")
 
-    # --- FILTRAGE STRICT SUR LA PÉRIODE DEMANDÉE ET SUPPRESSION DES PAYS MANQUANTS ---
-    n_before = len(result)
-    result = result[(result["Year"] >= year_start) & (result["Year"] <= year_end)]
-    n_after_period = len(result)
-    if n_after_period < n_before:
-        logger.warning(f"{n_before - n_after_period} lignes hors période [{year_start}-{year_end}] supprimées du panel final.")
-    n_before_country = len(result)
-    result = result[result["Country"].notna()]
-    n_after_country = len(result)
-    if n_after_country < n_before_country:
-        logger.warning(f"{n_before_country - n_after_country} lignes supprimées car Country=NaN après filtrage période.")
-
-    # --- FILTRAGE FINAL : années et pays valides ---
-    before = len(result)
-    result = result[(result['Year'] >= year_start) & (result['Year'] <= year_end)]
-    logger.info(f"Filtrage années [{year_start}, {year_end}] : {before - len(result)} lignes supprimées")
-    before2 = len(result)
-    result = result[result['Country'].notna()]
-    logger.info(f"Filtrage Country non-NaN : {before2 - len(result)} lignes supprimées")
+    # --- FILTRAGE STRICT SUR LA PÉRIODE DEMANDÉE ET SUPPRESSION DES PAYS MANQUANTS (un seul masque) ---
+    in_period = (result["Year"] >= year_start) & (result["Year"] <= year_end)
+    has_country = result["Country"].notna()
+    n_out_period = int((~in_period).sum())
+    n_no_country = int((in_period & ~has_country).sum())
+    if n_out_period:
+        logger.warning(f"{n_out_period} lignes hors période [{year_start}-{year_end}] supprimées du panel final.")
+    if n_no_country:
+        logger.warning(f"{n_no_country} lignes supprimées car Country=NaN après filtrage période.")
+    result = result[in_period & has_country]
 
     # Summary and preview
     n_obs = len(result)
@@ -689,31 +730,28 @@ def create_disaster_dataset(
         f"  • Countries    : {n_iso}\n"
         f"  • Reference year: {ref_year} | Poor countries: {n_poor} | Small countries: {n_small}\n"
     )
-    # Affichage concis d'un échantillon
+    # Affichage concis d'un échantillon (construit seulement si un handler accepte le niveau DEBUG)
     preview_cols = [col for col in result.columns if any(s in col for s in ["Year", "Country", "ISO", "deaths", "events"])]
-    logger.debug(f"\nAperçu (quelques lignes):\n{result[preview_cols].head(5).to_string(index=False)}")
+    logger.opt(lazy=True).debug(
+        "\nAperçu (quelques lignes):\n{}", lambda: result[preview_cols].head(5).to_string(index=False)
+    )
 
     # --- DISASTER INDEX (GeoMet composite, normalisé) ---
     # 1. Chercher toutes les colonnes *_intensity (GeoMet)
     intensity_cols = [col for col in result.columns if col.endswith('_intensity')]
     if intensity_cols:
-        # 2. Normaliser chaque colonne (écart-type sur tout le panel)
-        norm_intensities = []
-        for col in intensity_cols:
-            std = result[col].std(skipna=True)
-            if std > 0:
-                norm = result[col] / std
-            else:
-                norm = result[col]
-            norm_intensities.append(norm)
+        # 2. Normaliser toutes les colonnes d'un coup (écart-type sur tout le panel, inchangé si nul)
+        intensities = result[intensity_cols]
+        stds = intensities.std(skipna=True).to_numpy()
+        safe_stds = np.where(stds > 0, stds, 1.0)
         # 3. Somme pondérée (somme des intensités normalisées)
-        result['disaster_index'] = sum(norm_intensities)
+        result['disaster_index'] = (intensities.to_numpy(dtype=float) / safe_stds).sum(axis=1)
         logger.info(f"Colonne disaster_index créée à partir de {intensity_cols} (somme des intensités normalisées)")
     else:
         logger.warning("Aucune colonne *_intensity trouvée pour calculer disaster_index (GeoMet)")
 
     # Save to cache
-    result.to_pickle(cache_file)
+    save_disasters_cache(result, CACHE_DIR, year_start, year_end)
     logger.info(f"Cache saved: {cache_file}")
 
     return result
@@ -2,16 +2,27 @@
 """
 Step 03: Prépare un dataset économétrique par période pour l'analyse R.
 Ce script fusionne les exports et désastres pour chaque période, garde les colonnes utiles, et sauvegarde un CSV par période sous le nom
-datasets/econometric_dataset_<period>.csv. Plus de dataset unique.
+datasets/econometric_dataset_<period>.parquet (et .csv si WRITE_CSV_DATASETS). Plus de dataset unique.
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import pandas as pd
 from loguru import logger
 import json
 import numpy as np
-from utils.utils import clean_iso_codes
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from utils.utils import (
+    clean_iso_codes,
+    load_exports_cache,
+    load_disasters_cache,
+    get_exports_cache_path,
+    get_disasters_cache_path,
+)
 
 # Load config from config.json
 CONFIG_PATH = Path(__file__).parent / "config.json"
@@ -22,51 +33,86 @@ CACHE_DIR = Path(config["CACHE_DIR"])
 DATASETS_DIR = Path(config["DATASETS_DIR"])
 EXPORT_PERIODS = [tuple(period) for period in config["EXPORT_PERIODS"]]
 LOG_LEVEL = config["LOG_LEVEL"]
+LEGACY_PICKLE_CACHE = config.get("LEGACY_PICKLE_CACHE", True)
+WRITE_CSV_DATASETS = config.get("WRITE_CSV_DATASETS", True)
+# Codes ISO exclus, normalisés une seule fois pour toutes les périodes
+EXCLUDED_ISO_CODES = frozenset(code.strip().upper() for code in config.get("EXCLUDED_ISO_CODES", []))
+# Préfixes de colonnes par type de catastrophe ("Extreme temperature" -> "extreme_temperature")
+DISASTER_DTYPE_KEYS = [dtype.lower().replace(' ', '_') for dtype in config.get("DISASTER_TYPES", [])]
 
 logger.remove()
 logger.add(sys.stderr, level=LOG_LEVEL)
 
-periods = {f"{start}_{end}": (start, end) for (start, end) in EXPORT_PERIODS}
 
-print("\n==================================\n    ✅ VALIDATE DATASETS (3/4)   \n==================================\n")
+def row_sum(frame: pd.DataFrame) -> np.ndarray:
+    # Somme par ligne sur un bloc NumPy contigu : entiers en int64, sinon NaN ignorés (comme sum(skipna=True))
+    values = frame.to_numpy()
+    if np.issubdtype(values.dtype, np.integer):
+        return values.sum(axis=1, dtype=np.int64)
+    return np.nansum(values.astype(np.float64, copy=False), axis=1)
 
-any_success = False
-for period, (start, end) in periods.items():
+
+def is_up_to_date(start: int, end: int) -> bool:
+    # Sorties plus récentes que les caches Parquet d'entrée, ce script et config.json : rien à reconstruire
+    sources = [
+        get_exports_cache_path(CACHE_DIR, f"{start}_{end}"),
+        get_disasters_cache_path(CACHE_DIR, start, end),
+        Path(__file__),
+        CONFIG_PATH,
+    ]
+    outputs = [DATASETS_DIR / f"econometric_dataset_{start}_{end}.parquet"]
+    if WRITE_CSV_DATASETS:
+        outputs.append(DATASETS_DIR / f"econometric_dataset_{start}_{end}.csv")
+    if not all(f.exists() for f in sources + outputs):
+        return False
+    return min(f.stat().st_mtime for f in outputs) > max(f.stat().st_mtime for f in sources)
+
+
+def process_period(start: int, end: int) -> bool:
+    """Construit et sauvegarde le dataset économétrique d'une période ; True si réussi."""
+    period_key = f"{start}_{end}"
+    if is_up_to_date(start, end):
+        logger.info(f"💾 Dataset {period_key} à jour (plus récent que les caches exports/désastres), reconstruction ignorée")
+        return True
     try:
-        # --- Load exports ---
-        exports_cache_file = CACHE_DIR / "exports_combined.pkl"
-        if not exports_cache_file.exists():
-            logger.error(f"Export cache file not found: {exports_cache_file}")
-            continue
-        exports_data = pd.read_pickle(exports_cache_file)
-        period_key = f"{start}_{end}"
+        # --- Load exports (chaque processus ne lit que le Parquet de sa période) ---
+        exports_data = load_exports_cache(CACHE_DIR, periods=[(start, end)])
         if period_key not in exports_data:
-            logger.error(f"Period {period_key} not found in export cache")
-            continue
-        exports = exports_data[period_key].copy()
+            logger.error(f"Period {period_key} not found in export cache ({CACHE_DIR})")
+            return False
+        exports = exports_data[period_key]
         # Nettoyage et exclusion des codes ISO après chargement exports
-        excluded_iso_codes = config.get("EXCLUDED_ISO_CODES", [])
-        exports = clean_iso_codes(exports, iso_col="ISO", exclude_iso_codes=excluded_iso_codes)
+        # (ISO en catégorie : le nettoyage et l'exclusion travaillent sur les codes entiers)
+        exports["ISO"] = exports["ISO"].astype("category")
+        exports = clean_iso_codes(exports, iso_col="ISO", exclude_iso_codes=EXCLUDED_ISO_CODES)
         # --- Load disasters ---
-        disasters_cache_file = CACHE_DIR / f"disasters_combined_{start}_{end}.pkl"
-        if not disasters_cache_file.exists():
-            logger.error(f"Disaster cache file not found: {disasters_cache_file}")
-            continue
-        disasters = pd.read_pickle(disasters_cache_file)
+        disasters = load_disasters_cache(CACHE_DIR, start, end, legacy_pickle=LEGACY_PICKLE_CACHE)
+        if disasters is None:
+            logger.error(f"Disaster cache file not found: {CACHE_DIR / f'disasters_combined_{start}_{end}.parquet'}")
+            return False
         # Nettoyage et exclusion des codes ISO après chargement disasters
-        disasters = clean_iso_codes(disasters, iso_col="ISO", exclude_iso_codes=excluded_iso_codes)
+        disasters = clean_iso_codes(disasters, iso_col="ISO", exclude_iso_codes=EXCLUDED_ISO_CODES)
         # --- Merge at product-country-year level ---
-        merged = exports.merge(disasters, on=["ISO", "Year"], how="inner")
-        # Nettoyage et exclusion des codes ISO après merge
-        merged = clean_iso_codes(merged, iso_col="ISO", exclude_iso_codes=excluded_iso_codes)
-        # --- Correction: restaurer la colonne Country si perdue lors du merge ---
+        # Jointure interne sur des ISO déjà nettoyés des deux côtés : pas de nouveau nettoyage après merge.
+        # Country vient des exports (noms Comtrade) : retirée du panel désastres pour éviter Country_x/Country_y,
+        # avec un seul nom par ISO (le dernier rencontré dans les exports, comme l'ancienne restauration)
+        if "Country" in exports.columns:
+            disasters = disasters.drop(columns="Country", errors="ignore")
+            # dict et non Series : avec un ISO catégoriel, Series.map aligne sur la position des catégories
+            last_names = dict(zip(exports["ISO"], exports["Country"]))
+            exports["Country"] = exports["ISO"].map(last_names)
+        # many_to_one : une seule ligne désastres par (ISO, Year), sinon MergeError
+        merged = exports.merge(disasters, on=["ISO", "Year"], how="inner", validate="many_to_one")
         if "Country" not in merged.columns:
-            if "Country" in exports.columns:
-                merged["Country"] = merged["ISO"].map(dict(zip(exports["ISO"], exports["Country"])))
-                logger.info("[MERGE] Colonne 'Country' restaurée à partir des exports après merge.")
-            else:
-                logger.error("Colonne 'Country' absente des exports et du merge. Impossible de continuer.")
-                raise ValueError("Colonne 'Country' absente des exports et du merge. Impossible de continuer.")
+            logger.error("Colonne 'Country' absente des exports et du merge. Impossible de continuer.")
+            raise ValueError("Colonne 'Country' absente des exports et du merge. Impossible de continuer.")
+        # Contrôle : chaque ISO du dataset garde son propre nom Comtrade
+        if "Country" in exports.columns:
+            pairs = merged[["ISO", "Country"]].drop_duplicates().astype(str)
+            wrong = pairs[pairs["Country"] != pairs["ISO"].map({str(k): str(v) for k, v in last_names.items()})]
+            if not wrong.empty:
+                logger.error(f"Noms de pays incohérents après merge : {wrong.head().values.tolist()}")
+                raise ValueError("Colonne 'Country' incohérente avec les noms Comtrade des exports.")
         # --- Correction: laisser is_agri en booléen natif (True/False) pour compatibilité R ---
         # (plus de conversion en 1/0 ici)
         # --- Dynamically detect disaster variables, significant event flags, and controls ---
@@ -86,9 +132,11 @@ for period, (start, end) in periods.items():
             col for col in ["is_poor_country", "is_small_country", "Population", "Income group"] if col in merged.columns
         ]
         # Combine all columns, preserving order and uniqueness
-        keep_cols = base_cols + disaster_cols + sig_flag_cols + control_cols
-        keep_cols = [col for i, col in enumerate(keep_cols) if col in merged.columns and col not in keep_cols[:i]]
-        merged_final = merged[keep_cols].copy()
+        merged_cols = set(merged.columns)
+        keep_cols = list(dict.fromkeys(
+            col for col in base_cols + disaster_cols + sig_flag_cols + control_cols if col in merged_cols
+        ))
+        merged_final = merged[keep_cols]
         # --- Contrôle strict des colonnes World Bank ---
         required_wb_cols = ['is_poor_country', 'is_small_country', 'Income group', 'Population']
         missing_wb_cols = [col for col in required_wb_cols if col not in merged_final.columns]
@@ -104,40 +152,64 @@ for period, (start, end) in periods.items():
         other_cols = [col for col in merged_final.columns if col not in required_cols]
         ordered_cols = [col for col in required_cols if col in merged_final.columns] + other_cols
         merged_final = merged_final[ordered_cols]
+        # Nouvelles colonnes calculées à part puis ajoutées en une seule concaténation (pas de fragmentation)
+        new_cols = {}
         # 1. ln_total_occurrence : log(1 + somme des événements majeurs)
         event_cols = [col for col in merged_final.columns if col.endswith('_events')]
         if event_cols:
-            merged_final['sum_events'] = merged_final[event_cols].sum(axis=1, skipna=True)
-            merged_final['ln_total_occurrence'] = np.log1p(merged_final['sum_events'])
+            new_cols['sum_events'] = row_sum(merged_final[event_cols])
+            new_cols['ln_total_occurrence'] = np.log1p(new_cols['sum_events'])
         # 2. ln_total_deaths : log(1 + somme des morts toutes catastrophes)
         death_cols = [col for col in merged_final.columns if col.endswith('_deaths')]
         if death_cols:
-            merged_final['sum_deaths'] = merged_final[death_cols].sum(axis=1, skipna=True)
-            merged_final['ln_total_deaths'] = np.log1p(merged_final['sum_deaths'])
-        # 3. Variables log par type de catastrophe (ex: ln_earthquake_count)
-        for dtype in config['DISASTER_TYPES']:
-            dtype_key = dtype.lower().replace(' ', '_')
-            count_col = f"{dtype_key}_events"
-            log_col = f"ln_{dtype_key}_count"
-            if count_col in merged_final.columns:
-                merged_final[log_col] = np.log1p(merged_final[count_col])
+            new_cols['sum_deaths'] = row_sum(merged_final[death_cols])
+            new_cols['ln_total_deaths'] = np.log1p(new_cols['sum_deaths'])
+        # 3. Variables log par type de catastrophe (ex: ln_earthquake_count), en un seul bloc
+        present_cols = set(merged_final.columns)
+        dtype_keys = [key for key in DISASTER_DTYPE_KEYS if f"{key}_events" in present_cols]
+        count_cols = [f"{key}_events" for key in dtype_keys]
+        log_cols = [f"ln_{key}_count" for key in dtype_keys]
+        if count_cols:
+            log_counts = np.log1p(merged_final[count_cols].to_numpy(dtype=np.float64))
+            new_cols.update(zip(log_cols, log_counts.T))
         # 4. Classification revenu simplifiée (income_group_internal)
         if 'Income group' in merged_final.columns:
-            merged_final['income_group_internal'] = np.where(
-                merged_final['Income group'].isin(['High income', 'Upper middle income']), 'High', 'Low')
+            is_high = merged_final['Income group'].isin(['High income', 'Upper middle income']).to_numpy()
+            new_cols['income_group_internal'] = pd.Categorical.from_codes(is_high.astype(np.int8), categories=['Low', 'High'])
         # 5. Classification taille simplifiée (size_group)
         if 'Population' in merged_final.columns:
             pop_median = merged_final['Population'].median(skipna=True)
-            merged_final['size_group'] = np.where(merged_final['Population'] > pop_median, 'Large', 'Small')
+            is_large = (merged_final['Population'] > pop_median).to_numpy()
+            new_cols['size_group'] = pd.Categorical.from_codes(is_large.astype(np.int8), categories=['Small', 'Large'])
+            new_cols['ln_population'] = np.log(merged_final['Population'].to_numpy())
+        if new_cols:
+            merged_final = pd.concat([merged_final, pd.DataFrame(new_cols, index=merged_final.index)], axis=1)
         # 6. d_ln_population : diff du log population par pays-année
         if 'Population' in merged_final.columns:
             merged_final = merged_final.sort_values(['ISO', 'cmdCode', 'Year'])
-            merged_final['ln_population'] = np.log(merged_final['Population'])
-            merged_final['d_ln_population'] = merged_final.groupby(['ISO', 'cmdCode'])['ln_population'].diff()
+            # Frame trié par (ISO, cmdCode, Year) : diff globale, remise à NaN à chaque changement de groupe
+            ln_pop = merged_final['ln_population'].to_numpy(dtype=np.float64)
+            d_ln_pop = np.full_like(ln_pop, np.nan)
+            if len(ln_pop) > 1:
+                d_ln_pop[1:] = ln_pop[1:] - ln_pop[:-1]
+                # NaN != NaN : les clés manquantes sont aussi des bornes, comme le dropna du groupby
+                new_group = np.zeros(len(ln_pop) - 1, dtype=bool)
+                for key in ['ISO', 'cmdCode']:
+                    key_values = merged_final[key].to_numpy()
+                    new_group |= key_values[1:] != key_values[:-1]
+                d_ln_pop[1:][new_group] = np.nan
+            merged_final['d_ln_population'] = d_ln_pop
         # 7. disaster_index : somme pondérée des intensités normalisées (GeoMet)
         intensity_cols = [col for col in merged_final.columns if col.endswith('_intensity')]
         if intensity_cols:
             merged_final['disaster_index'] = merged_final[intensity_cols].sum(axis=1, skipna=True)
+        # 8. Types compacts avant écriture : textes répétitifs en catégories, totaux entiers réduits.
+        # Les indicateurs restent en int8 (0/1) : le CSV lu par R doit garder des 1/0, pas True/False.
+        text_cols = ['ISO', 'Country', 'Income group']
+        merged_final = merged_final.astype({col: 'category' for col in text_cols if col in merged_final.columns})
+        for col in ['sum_events', 'sum_deaths']:
+            if col in merged_final.columns:
+                merged_final[col] = pd.to_numeric(merged_final[col], downcast='integer')
         # --- Logging summary ---
         n_obs = len(merged_final)
         n_iso = merged_final['ISO'].nunique() if 'ISO' in merged_final.columns else 'N/A'
@@ -177,25 +249,51 @@ for period, (start, end) in periods.items():
         logger.trace(f"Columns:\n{list(merged_final.columns)}\n")
         # --- Diagnostic croisé pour NA R : présence des combinaisons critiques ---
         # Pour chaque type de catastrophe, compter les lignes *_sig_* == 1 par sous-groupe
-        disaster_types = config.get('DISASTER_TYPES', [])
-        sig_flags = [col for col in merged_final.columns if col.endswith('_sig_p90') or col.endswith('_sig_anydeaths') or col.endswith('_sig_abs1000')]
-        for dtype in disaster_types:
-            dtype_key = dtype.lower().replace(' ', '_')
-            for flag in ['sig_p90', 'sig_anydeaths', 'sig_abs1000']:
-                colname = f"{dtype_key}_{flag}"
-                if colname in merged_final.columns:
-                    for group, group_label in [("is_poor_country", "Poor"), ("is_small_country", "Small")]:
-                        if group in merged_final.columns:
-                            n = merged_final.query(f"{group} == 1 and {colname} == 1").shape[0]
-                            logger.debug(f"[DIAG] {colname} & {group}=1 : {n} lignes")
+        present_cols = set(merged_final.columns)
+        flag_cols = [
+            f"{key}_{flag}"
+            for key in DISASTER_DTYPE_KEYS
+            for flag in ['sig_p90', 'sig_anydeaths', 'sig_abs1000']
+            if f"{key}_{flag}" in present_cols
+        ]
+        group_cols = [group for group in ["is_poor_country", "is_small_country"] if group in merged_final.columns]
+        if flag_cols and group_cols:
+            # Tous les comptages (groupe == 1 et indicateur == 1) en un seul produit matriciel
+            flags = (merged_final[flag_cols].to_numpy() == 1).astype(np.int64)
+            groups = (merged_final[group_cols].to_numpy() == 1).astype(np.int64)
+            counts = groups.T @ flags
+            for j, colname in enumerate(flag_cols):
+                for i, group in enumerate(group_cols):
+                    logger.debug(f"[DIAG] {colname} & {group}=1 : {counts[i, j]} lignes")
         # --- Save ---
         DATASETS_DIR.mkdir(exist_ok=True)
-        out_csv = DATASETS_DIR / f"econometric_dataset_{start}_{end}.csv"
-        merged_final.to_csv(out_csv, index=False)
-        logger.info(f"✅ Saved econometric dataset: {out_csv.name} ({n_obs:,} rows)")
-        any_success = True
+        # Parquet (typé, compressé) systématique ; CSV conservé pour les scripts R tant que WRITE_CSV_DATASETS est actif
+        out_parquet = DATASETS_DIR / f"econometric_dataset_{start}_{end}.parquet"
+        # Conversion Arrow faite une seule fois, partagée par les écritures Parquet et CSV
+        table = pa.Table.from_pandas(merged_final, preserve_index=False)
+        pq.write_table(table, out_parquet, compression="zstd")
+        logger.info(f"✅ Saved econometric dataset: {out_parquet.name} ({n_obs:,} rows)")
+        if WRITE_CSV_DATASETS:
+            out_csv = DATASETS_DIR / f"econometric_dataset_{start}_{end}.csv"
+            # Écriture CSV par le writer C++ d'Arrow (formatage vectorisé, multi-thread)
+            pacsv.write_csv(table, out_csv)
+            logger.info(f"✅ Saved econometric dataset: {out_csv.name} ({n_obs:,} rows)")
+        return True
     except Exception as e:
-        logger.error(f"Error during dataset preparation for period {period}: {e}")
-if not any_success:
-    logger.error("❌ Aucune période n'a pu être traitée correctement.\n")
-    sys.exit(1)
\ No newline at end of file
+        logger.error(f"Error during dataset preparation for period {period_key}: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    print("\n==================================\n    ✅ VALIDATE DATASETS (3/4)   \n==================================\n")
+    # Périodes indépendantes (lecture, merge, écriture) : une par processus
+    periods = list(dict.fromkeys(EXPORT_PERIODS))
+    max_workers = max(1, min(len(periods), os.cpu_count() or 1))
+    if max_workers == 1:
+        results = [process_period(start, end) for (start, end) in periods]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(process_period, *zip(*periods)))
+    if not any(results):
+        logger.error("❌ Aucune période n'a pu être traitée correctement.\n")
+        sys.exit(1)
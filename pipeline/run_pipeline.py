@@ -31,21 +31,25 @@ EXCLUDED_ISO_CODES = config.get("EXCLUDED_ISO_CODES", [])
 PERIODS = config.get("EXPORT_PERIODS", [])
 DISASTER_TYPES = config.get("DISASTER_TYPES", [])
 
-print("="*100)
-print("   🚦 PIPELINE CONFIGURATION   ")
-print("="*100)
-print(f"🗂️  DATA_DIR      : {DATA_DIR}")
-print(f"🗃️  CACHE_DIR     : {CACHE_DIR}")
-print(f"📊 RESULTS_DIR   : {RESULTS_DIR}")
-print(f"📑 TABLES_DIR    : {TABLES_DIR}")
-print(f"🗝️  USE_CACHE     : {USE_CACHE}")
-print(f"🧹 CLEAR_CACHE   : {CLEAR_CACHE}")
-print(f"📆 EXPORT_PERIODS: {PERIODS}")
-print(f"🌪️  DISASTER_TYPES: {DISASTER_TYPES}")
-print("🔒 EXCLUDED_ISO_CODES:")
-for i in range(0, len(EXCLUDED_ISO_CODES), 10):
-    print("\t" + ", ".join(EXCLUDED_ISO_CODES[i:i+10]))
-print("="*100 + "\n")
+# Bannière de configuration assemblée puis écrite en une seule fois
+banner_lines = [
+    "="*100,
+    "   🚦 PIPELINE CONFIGURATION   ",
+    "="*100,
+    f"🗂️  DATA_DIR      : {DATA_DIR}",
+    f"🗃️  CACHE_DIR     : {CACHE_DIR}",
+    f"📊 RESULTS_DIR   : {RESULTS_DIR}",
+    f"📑 TABLES_DIR    : {TABLES_DIR}",
+    f"🗝️  USE_CACHE     : {USE_CACHE}",
+    f"🧹 CLEAR_CACHE   : {CLEAR_CACHE}",
+    f"📆 EXPORT_PERIODS: {PERIODS}",
+    f"🌪️  DISASTER_TYPES: {DISASTER_TYPES}",
+    "🔒 EXCLUDED_ISO_CODES:",
+]
+banner_lines += ["\t" + ", ".join(EXCLUDED_ISO_CODES[i:i+10]) for i in range(0, len(EXCLUDED_ISO_CODES), 10)]
+banner_lines.append("="*100 + "\n")
+sys.stdout.write("\n".join(banner_lines) + "\n")
+sys.stdout.flush()
 
 PIPELINE_STEPS = [
     ("01_collect_exports_data.py", "Collecte et nettoyage des exports (UN Comtrade)"),
@@ -66,27 +70,39 @@ for d in [DATA_DIR, CACHE_DIR, RESULTS_DIR, TABLES_DIR, Path(config.get("DATASET
     d.mkdir(parents=True, exist_ok=True)
 
 
-def run_step(idx, step_file, description, rscript=False):
+def launch_step(idx, step_file, description, rscript=False, env=None):
+    """Démarre une étape sans attendre sa fin ; renvoie le Popen, ou None si le script est absent."""
     logger.info(f"[STEP {idx+1}] {description}\n")
     script_path = PIPELINE_DIR / step_file
     if not script_path.exists():
         logger.error(f"Fichier manquant : {script_path}")
-        return False
-    cmd = ["Rscript", str(script_path)] if rscript else [sys.executable, str(script_path)]
-    if step_file.endswith(".R"):
-        cmd = ["Rscript", str(script_path)]
+        return None
+    is_r = rscript or step_file.endswith(".R")
+    cmd = ["Rscript", str(script_path)] if is_r else [sys.executable, str(script_path)]
     try:
-        result = subprocess.run(cmd, check=True)
-        print("="*100)
-        return True
-    except subprocess.CalledProcessError as e:
-        logger.error(f"❌ Erreur lors de l'exécution de {step_file} : {e}")
-        print("="*100)
-        return False
+        return subprocess.Popen(cmd, env=env)
     except Exception as e:
         logger.error(f"❌ Exception inattendue lors de l'exécution de {step_file} : {e}")
         print("="*100)
+        return None
+
+
+def finalize_step(step_file, process):
+    """Attend la fin d'une étape lancée par launch_step et journalise son code retour."""
+    if process is None:
+        return False
+    returncode = process.wait()
+    print("="*100)
+    if returncode != 0:
+        error = subprocess.CalledProcessError(returncode, process.args)
+        logger.error(f"❌ Erreur lors de l'exécution de {step_file} : {error}")
         return False
+    return True
+
+
+def run_step(idx, step_file, description, rscript=False):
+    # Étapes 01 -> 02 -> 03 dépendantes (02 lit le cache exports de 01 pour le panel) : exécution bloquante
+    return finalize_step(step_file, launch_step(idx, step_file, description, rscript=rscript))
 
 
 def main():
@@ -96,26 +112,38 @@ def main():
     parser.add_argument("--fetch_missing", action="store_true", help="Forcer la récupération des années manquantes (si supporté)")
     args = parser.parse_args()
 
-    # Exécution d'une étape précise
+    # Une étape précise, ou toutes les étapes en séquence stricte
     if args.step:
         idx = args.step - 1
         if idx < 0 or idx >= len(PIPELINE_STEPS):
             logger.error("Numéro d'étape invalide. Choisir entre 1 et 4.")
             sys.exit(1)
+        selected = [idx]
+    else:
+        selected = range(len(PIPELINE_STEPS))
+
+    # Étapes 04 et 04b : lecture seule des datasets, sorties disjointes -> lancées en parallèle
+    r_steps = [i for i in selected if PIPELINE_STEPS[i][0].endswith(".R")] if not args.step else []
+    for idx in selected:
+        if idx in r_steps:
+            continue
         step_file, description = PIPELINE_STEPS[idx]
-        ok = run_step(idx, step_file, description, rscript=step_file.endswith(".R"))
+        ok = run_step(idx, step_file, description)
         if not ok:
             logger.error(f"Arrêt du pipeline à l'étape {idx+1}.")
             sys.exit(1)
-        return
 
-    # Exécution séquentielle stricte de toutes les étapes
-    for idx, (step_file, description) in enumerate(PIPELINE_STEPS):
-        ok = run_step(idx, step_file, description, rscript=step_file.endswith(".R"))
-        if not ok:
-            logger.error(f"Arrêt du pipeline à l'étape {idx+1}.")
+    if r_steps:
+        # Partage des cœurs entre les deux analyses (sauf si l'utilisateur a fixé OMP_NUM_THREADS)
+        r_env = os.environ.copy()
+        r_env.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // len(r_steps))))
+        launched = [(idx, launch_step(idx, *PIPELINE_STEPS[idx], env=r_env)) for idx in r_steps]
+        failed = [idx for idx, process in launched if not finalize_step(PIPELINE_STEPS[idx][0], process)]
+        if failed:
+            logger.error(f"Arrêt du pipeline à l'étape {failed[0]+1}.")
             sys.exit(1)
-    logger.info("\n🎉 Pipeline complet exécuté avec succès !")
+    if not args.step:
+        logger.info("\n🎉 Pipeline complet exécuté avec succès !")
 
 if __name__ == "__main__":
     try:
@@ -14,14 +14,62 @@ import os
 import pandas as pd
 import numpy as np
 import io
+import re
+import threading
 import contextlib
+import csv
 import time
-import glob
 import comtradeapicall
 import pickle
+import pyarrow as pa
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dotenv import load_dotenv
 
+# Colonnes des CSV Comtrade effectivement utilisées par get_exports_dataframe, avec leurs types
+EXPORTS_CSV_DTYPES = {
+    "reporterISO": "category",
+    "reporterDesc": "category",
+    "refYear": "int16",
+    "cmdCode": "str",  # converti ensuite en numérique (codes non entiers, ex. "TOTAL" -> NaN)
+    "cmdDesc": "category",
+    "fobvalue": "float64",
+}
+
+
+# Années couvertes par un fichier d'exports : plage "YYYY-YYYY_exports" ou année simple "YYYY_exports"
+_YEAR_RANGE_RE = re.compile(r"(\d{4})-(\d{4})_exports")
+_SINGLE_YEAR_RE = re.compile(r"(\d{4})_exports")
+
+
+def _extract_years_from_filename(filename):
+    """Extrait les années d'un nom de fichier d'exports (suffixes possibles)."""
+    range_match = _YEAR_RANGE_RE.search(filename)
+    if range_match:
+        return list(range(int(range_match.group(1)), int(range_match.group(2)) + 1))
+    single_year_match = _SINGLE_YEAR_RE.search(filename)
+    if single_year_match:
+        return [int(single_year_match.group(1))]
+    return []
+
+
+def _list_export_files(directory):
+    """Liste triée des fichiers "*exports*.csv" d'un dossier, en couples (chemin, nom), en un seul scandir."""
+    try:
+        with os.scandir(directory) as it:
+            entries = [
+                (entry.path, entry.name)
+                for entry in it
+                if "exports" in entry.name
+                and entry.name.endswith(".csv")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+    return sorted(entries, key=lambda e: e[1])
+
 
 def get_exports_dataframe(
     input_path: str = "data/exports/",
@@ -30,6 +78,7 @@ def get_exports_dataframe(
     max_records: int = 5000,
     replace: bool = False,
     fetch_missing: bool = False,
+    cache_dir: str = "cache",
 ) -> pd.DataFrame:
     """
     Génère un DataFrame d'exports filtré pour la période spécifiée.
@@ -43,59 +92,35 @@ def get_exports_dataframe(
         max_records: Nombre max d'enregistrements par requête
         replace: Remplacer les fichiers existants
         fetch_missing: Télécharger les années manquantes
+        cache_dir: Dossier des copies Parquet des CSV d'exports
 
     Returns:
         DataFrame avec les données d'exports filtrées
     """
 
-    def extract_years_from_filename(filename):
-        """Extrait les années d'un nom de fichier."""
-        # Pattern 1: Plage d'années - YYYY-YYYY_exports (avec suffixes possibles)
-        range_match = re.search(r"(\d{4})-(\d{4})_exports", filename)
-        if range_match:
-            start_year = int(range_match.group(1))
-            end_year = int(range_match.group(2))
-            return list(range(start_year, end_year + 1))
-
-        # Pattern 2: Année simple - YYYY_exports (avec suffixes possibles)
-        single_year_match = re.search(r"(\d{4})_exports", filename)
-        if single_year_match:
-            return [int(single_year_match.group(1))]
-
-        return []
-
-    # Rechercher tous les fichiers d'exports
-    all_export_files = sorted(glob.glob(f"{input_path}*exports*.csv"))
-
-    # Mapping direct fichier -> années
-    file_coverage = {}
-    for file in all_export_files:
-        filename = os.path.basename(file)
-        years = extract_years_from_filename(filename)
-        if years:
-            file_coverage[file] = years
-            year_range = (
-                f"{min(years)}-{max(years)}" if len(years) > 1 else str(years[0])
-            )
-            logger.trace(f"📁 {filename} → {year_range}")
-
-    # Sélectionner les fichiers qui couvrent la période demandée
-    target_years = set(range(year_start, year_end + 1))
+    # Sélectionner en une passe les fichiers qui couvrent la période demandée
+    target_years = frozenset(range(year_start, year_end + 1))
     files_to_load = []
     years_covered = set()
 
-    for file_path, file_years in file_coverage.items():
-        overlap = set(file_years).intersection(target_years)
+    for file_path, filename in _list_export_files(input_path):
+        years = _extract_years_from_filename(filename)
+        if not years:
+            continue
+        year_range = f"{min(years)}-{max(years)}" if len(years) > 1 else str(years[0])
+        logger.trace(f"📁 {filename} → {year_range}")
+
+        overlap = target_years.intersection(years)
         if overlap:
             files_to_load.append(file_path)
-            years_covered.update(overlap)
+            years_covered |= overlap
 
             year_range = (
                 f"{min(overlap)}-{max(overlap)}"
                 if len(overlap) > 1
-                else str(list(overlap)[0])
+                else str(next(iter(overlap)))
             )
-            logger.trace(f"✅ {os.path.basename(file_path)} → couvre {year_range}")
+            logger.trace(f"✅ {filename} → couvre {year_range}")
 
     missing_years = sorted(target_years - years_covered)
 
@@ -130,23 +155,43 @@ def get_exports_dataframe(
             logger.warning("🔄 Téléchargement non supporté dans cette version pipeline")
             return pd.DataFrame()
 
-    # Charger les fichiers existants
-    exports_all = []
-    for file in files_to_load:
+    # Charger les fichiers existants (fichiers indépendants : lecture en parallèle, le parseur C libère le GIL)
+    def read_one(file):
         try:
-            df = pd.read_csv(
-                file, encoding="latin1", sep=None, engine="python", index_col=False
-            )
-            exports_all.append(df)
+            cache_file = _csv_to_parquet_cache(file, cache_dir)
+            if cache_file is None:
+                # Copie Parquet impossible (dossier en lecture seule, disque plein...) : lecture directe du CSV
+                df = _read_exports_csv(file)
+                df = df[(df["refYear"] >= year_start) & (df["refYear"] <= year_end)]
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            else:
+                # Seules les colonnes et années utiles sont lues depuis la copie Parquet
+                table = pq.read_table(
+                    cache_file,
+                    columns=list(EXPORTS_CSV_DTYPES),
+                    filters=[("refYear", ">=", year_start), ("refYear", "<=", year_end)],
+                    memory_map=True,
+                )
             logger.trace(f"✅ Chargé: {os.path.basename(file)}")
+            return table
         except Exception as e:
             logger.error(f"❌ Erreur lors du chargement de {file}: {e}")
+            return None
+
+    max_workers = max(1, min(len(files_to_load), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map conserve l'ordre des fichiers -> concaténation identique à la version séquentielle
+        exports_all = [t for t in executor.map(read_one, files_to_load) if t is not None]
 
     if not exports_all:
         logger.warning("❌ Aucun fichier n'a pu être chargé")
         return pd.DataFrame()
 
-    exports = pd.concat(exports_all, ignore_index=True)
+    # Concaténation Arrow sans copie (dictionnaires unifiés entre fichiers), une seule conversion pandas
+    table = pa.concat_tables(exports_all, promote_options="permissive").unify_dictionaries()
+    del exports_all
+    exports = table.to_pandas(self_destruct=True, split_blocks=True)
+    del table
     logger.debug(f"📊 Chargement réussi : {len(exports)} lignes")
 
     # Nettoyage et préparation
@@ -154,13 +199,16 @@ def get_exports_dataframe(
         logger.error("❌ Aucune donnée d'export disponible")
         return pd.DataFrame()
 
-    # Créer l'indicateur agricole
-    exports["is_agri"] = exports["cmdCode"].isin(range(1, 25))
+    # Créer l'indicateur agricole (chapitres HS 01-24 ; cmdCode est numérique à la lecture, NaN -> False)
+    cmd = exports["cmdCode"].to_numpy()
+    exports["is_agri"] = (cmd >= 1) & (cmd <= 24)
 
-    # Filtrer pour la période demandée et nettoyer
-    exports_filtered = exports[
-        (exports["refYear"] >= year_start) & (exports["refYear"] <= year_end)
-    ][
+    # Filtrer pour la période demandée et nettoyer : un seul masque (NaN > 0 est faux -> fobvalue manquant exclu)
+    years = exports["refYear"].to_numpy()
+    fob = exports["fobvalue"].to_numpy()
+    mask = (years >= year_start) & (years <= year_end) & (fob > 0)
+    exports_filtered = exports.loc[
+        mask,
         [
             "reporterISO",
             "reporterDesc",
@@ -169,12 +217,8 @@ def get_exports_dataframe(
             "cmdDesc",
             "is_agri",
             "fobvalue",
-        ]
-    ].copy()
-
-    exports_filtered = exports_filtered.dropna(subset=["fobvalue"]).query(
-        "fobvalue > 0"
-    )
+        ],
+    ]
 
     # Résumé final avec vraies données
     if not exports_filtered.empty:
@@ -197,6 +241,98 @@ def get_exports_dataframe(
 
     return exports_filtered
 
+def _sniff_csv_separator(csv_path) -> str:
+    """Détecte le séparateur d'un CSV sur sa ligne d'en-tête (virgule par défaut)."""
+    with open(csv_path, "r", encoding="latin1", newline="") as f:
+        header = f.readline()
+    try:
+        return csv.Sniffer().sniff(header, delimiters=",;\t|").delimiter
+    except csv.Error:
+        return ","
+
+
+def _read_exports_csv(csv_path) -> pd.DataFrame:
+    """Lit un CSV Comtrade (colonnes et types de EXPORTS_CSV_DTYPES) avec le parseur C."""
+    df = pd.read_csv(
+        csv_path,
+        encoding="latin1",
+        sep=_sniff_csv_separator(csv_path),
+        engine="c",
+        index_col=False,
+        usecols=list(EXPORTS_CSV_DTYPES),
+        dtype=EXPORTS_CSV_DTYPES,
+        low_memory=False,
+    )
+    # Comme à l'étape 01 : cmdCode non numérique ou manquant -> NaN, puis plus petit type entier possible
+    df["cmdCode"] = pd.to_numeric(
+        pd.to_numeric(df["cmdCode"], errors="coerce"), downcast="integer"
+    )
+    return df
+
+
+def _csv_to_parquet_cache(csv_path, cache_dir):
+    """
+    Retourne la copie Parquet d'un CSV d'exports, en la (re)générant si besoin.
+
+    La copie "<fichier>.csv.parquet" est écrite dans le dossier de cache (zstd)
+    lorsqu'elle est absente ou plus ancienne que la source ; les lectures
+    suivantes évitent ainsi tout parsing CSV.
+
+    Args:
+        csv_path: Chemin du fichier CSV d'exports
+        cache_dir: Dossier de cache du pipeline
+
+    Returns:
+        Path vers la copie Parquet, ou None si elle ne peut pas être écrite
+    """
+    csv_path = Path(csv_path)
+    cache_file = Path(cache_dir) / f"{csv_path.name}.parquet"
+    if not cache_file.exists() or cache_file.stat().st_mtime < csv_path.stat().st_mtime:
+        df = _read_exports_csv(csv_path)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_file, engine="pyarrow", compression="zstd", index=False)
+            logger.debug(f"Copie Parquet de {csv_path.name} écrite : {cache_file}")
+        except Exception as e:
+            logger.debug(f"Pas de copie Parquet pour {csv_path.name} : {e}")
+            # Copie partielle éventuelle supprimée pour ne pas être relue à la prochaine exécution
+            with contextlib.suppress(OSError):
+                cache_file.unlink(missing_ok=True)
+            return None
+    return cache_file
+
+
+class _ThreadLocalCapture(io.TextIOBase):
+    """
+    Flux de sortie capturant séparément ce qu'écrit chaque thread.
+
+    contextlib.redirect_stdout remplace sys.stdout pour tout le processus :
+    installé une fois, ce flux renvoie les écritures d'un thread dans son
+    propre tampon pendant capture(), et vers le flux d'origine sinon.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def capture(self):
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer if buffer is not None else self._fallback).write(text)
+
+    def flush(self):
+        if getattr(self._local, "buffer", None) is None:
+            self._fallback.flush()
+
+
 def _check_year_has_data(
     year: int, breakdown_mode: str = "plus", max_records: int = 100
 ) -> bool:
@@ -252,10 +388,26 @@ def fetch_comtrade_exports(
     max_records: int = 5000,
     year_start: int = 1979,
     year_end: int = 2024,
+    max_workers: int = 4,
+    min_request_interval: float = 0.25,
 ):
-    """Télécharge les données Comtrade pour une période donnée."""
-    import re
+    """
+    Télécharge les données Comtrade pour une période donnée.
+
+    Au plus max_workers requêtes simultanées, deux départs de requête étant
+    espacés d'au moins min_request_interval secondes.
+    """
     start_time = time.time()
+    throttle_lock = threading.Lock()
+    next_request_at = [0.0]
+
+    def throttle():
+        # Réserve le prochain créneau de départ puis attend hors verrou
+        with throttle_lock:
+            start_at = max(time.monotonic(), next_request_at[0])
+            next_request_at[0] = start_at + min_request_interval
+        time.sleep(max(0.0, start_at - time.monotonic()))
+
     all_dfs_exports = []
     skipped_years = []
     quota_exceeded = False
@@ -263,20 +415,9 @@ def fetch_comtrade_exports(
     os.makedirs(output_path, exist_ok=True)
 
     # --- NOUVEAU : détection des années déjà couvertes localement (multi-années inclus) ---
-    export_files = sorted(glob.glob(os.path.join(output_path, '*exports*.csv')))
     years_covered = set()
-    def extract_years_from_filename(filename):
-        range_match = re.search(r"(\d{4})-(\d{4})_exports", filename)
-        if range_match:
-            start_year = int(range_match.group(1))
-            end_year = int(range_match.group(2))
-            return list(range(start_year, end_year + 1))
-        single_year_match = re.search(r"(\d{4})_exports", filename)
-        if single_year_match:
-            return [int(single_year_match.group(1))]
-        return []
-    for file in export_files:
-        years_covered.update(extract_years_from_filename(os.path.basename(file)))
+    for _, filename in _list_export_files(output_path):
+        years_covered.update(_extract_years_from_filename(filename))
     target_years = set(range(year_start, year_end + 1))
     missing_years = sorted(target_years - years_covered)
     logger.debug(f"Années déjà couvertes: {sorted(years_covered)}")
@@ -323,13 +464,16 @@ def fetch_comtrade_exports(
                 continue
         # Téléchargement des données
         logger.info(f"🔄 Traitement année {year}...")
-        df_year_cmd = []
-        for cmd_code in range(1, 100):
-            if quota_exceeded:
-                break
-            try:
-                f = io.StringIO()
-                with contextlib.redirect_stdout(f), contextlib.redirect_stderr(f):
+        quota_event = threading.Event()
+
+        def fetch_one(cmd_code):
+            """Renvoie (DataFrame ou None, texte affiché par comtradeapicall pour cette requête)."""
+            # Requêtes restantes abandonnées dès qu'un quota épuisé est détecté
+            if quota_event.is_set():
+                return None, ""
+            throttle()
+            with capture.capture() as out:
+                try:
                     df = comtradeapicall.previewFinalData(
                         typeCode="C",
                         freqCode="A",
@@ -349,24 +493,44 @@ def fetch_comtrade_exports(
                         countOnly=None,
                         includeDesc=True,
                     )
-                api_output = f.getvalue()
-                if "403" in api_output or "quota" in api_output.lower():
-                    logger.error(
-                        f"🚫 QUOTA API ÉPUISÉ à l'année {year}, produit {cmd_code}"
-                    )
-                    quota_exceeded = True
-                    break
-                if df is None or len(df) == 0:
-                    continue
-                if len(df) >= max_records:
-                    logger.warning(
-                        f"Year {year}, Code {cmd_code:02}: Max records exceeded ({max_records})"
-                    )
-                    continue
-                df_year_cmd.append(df)
-            except Exception as e:
-                logger.warning(f"⚠️ Erreur année {year}, produit {cmd_code}: {e}")
-                continue
+                except Exception as e:
+                    logger.warning(f"⚠️ Erreur année {year}, produit {cmd_code}: {e}")
+                    df = None
+            return df, out.getvalue()
+
+        # Les 99 chapitres HS sont indépendants : requêtes concurrentes (latence réseau), en nombre
+        # limité et espacées d'au moins min_request_interval pour rester sous la limite de l'API.
+        # La sortie de comtradeapicall est capturée par thread : le quota est vérifié requête par requête.
+        results = {}
+        capture = _ThreadLocalCapture(sys.stdout)
+        with contextlib.redirect_stdout(capture), contextlib.redirect_stderr(capture):
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(fetch_one, cmd_code): cmd_code for cmd_code in range(1, 100)}
+                for future in as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    cmd_code = futures[future]
+                    df, api_output = future.result()
+                    if "403" in api_output or "quota" in api_output.lower():
+                        if not quota_event.is_set():
+                            logger.error(
+                                f"🚫 QUOTA API ÉPUISÉ à l'année {year}, produit {cmd_code}"
+                            )
+                            quota_event.set()
+                            for pending in futures:
+                                pending.cancel()
+                        continue
+                    if df is None or len(df) == 0:
+                        continue
+                    if len(df) >= max_records:
+                        logger.warning(
+                            f"Year {year}, Code {cmd_code:02}: Max records exceeded ({max_records})"
+                        )
+                        continue
+                    results[cmd_code] = df
+        quota_exceeded = quota_event.is_set()
+        # Ordre des chapitres conservé pour le fichier annuel
+        df_year_cmd = [results[cmd_code] for cmd_code in sorted(results)]
         if quota_exceeded:
             break
         # Sauvegarder les données de l'année
@@ -420,17 +584,253 @@ def clean_iso_codes(df, iso_col="ISO", exclude_iso_codes=None):
         exclude_iso_codes: Liste ou ensemble de codes ISO à exclure (optionnel)
 
     Returns:
-        DataFrame avec codes ISO nettoyés et exclus
+        DataFrame avec codes ISO nettoyés et exclus (colonne catégorielle conservée en catégorie)
     """
-    df[iso_col] = df[iso_col].astype(str).str.strip().str.upper()
-    df = df[df[iso_col].notna() & (df[iso_col] != "NAN")]
-    df = df[df[iso_col].str.len() == 3]
+    # Nettoyage sur les codes distincts (quelques centaines) puis report sur les lignes via les codes factorisés
+    codes, uniques = pd.factorize(df[iso_col])
+    cleaned = pd.Index(uniques).astype(str).str.strip().str.upper()
+    keep = (cleaned != "NAN") & (cleaned.str.len() == 3)
     if exclude_iso_codes is not None:
         exclude_set = set([code.strip().upper() for code in exclude_iso_codes])
-        df = df[~df[iso_col].isin(exclude_set)]
+        keep &= ~cleaned.isin(exclude_set)
+    # Code -1 : valeur manquante, toujours écartée
+    keep = np.asarray(keep)
+    keep_rows = np.append(keep, False)[codes]
+    is_categorical = isinstance(df[iso_col].dtype, pd.CategoricalDtype)
+    df = df[keep_rows].copy()
+    if is_categorical:
+        # Colonne catégorielle : reste catégorielle (codes entiers, pas de tableau de chaînes par ligne) ;
+        # deux valeurs brutes qui se nettoient en un même code ISO partagent la même catégorie
+        new_codes, categories = pd.factorize(cleaned[keep], sort=True)
+        unique_to_code = np.full(len(uniques), -1, dtype=np.int64)
+        unique_to_code[keep] = new_codes
+        df[iso_col] = pd.Categorical.from_codes(unique_to_code[codes[keep_rows]], categories=categories)
+    else:
+        df[iso_col] = np.asarray(cleaned, dtype=object)[codes[keep_rows]]
     return df
 
 
+def get_exports_cache_path(cache_dir, period_name: str) -> Path:
+    """
+    Retourne le chemin du cache Parquet des exports pour une période.
+
+    Args:
+        cache_dir: Dossier de cache du pipeline
+        period_name: Nom de la période ("<début>_<fin>")
+
+    Returns:
+        Path vers le fichier exports_combined_<période>.parquet
+    """
+    return Path(cache_dir) / f"exports_combined_{period_name}.parquet"
+
+
+def save_exports_cache(results: dict, cache_dir) -> None:
+    """
+    Sauvegarde le cache des exports : un fichier Parquet (zstd) par période.
+
+    Args:
+        results: Dictionnaire {période: DataFrame}
+        cache_dir: Dossier de cache du pipeline
+    """
+    for period_name, df in results.items():
+        df.to_parquet(
+            get_exports_cache_path(cache_dir, period_name),
+            compression="zstd",
+            index=False,
+        )
+
+
+def load_exports_cache(cache_dir, periods=None, columns=None) -> dict:
+    """
+    Charge le cache des exports produit par l'étape 01.
+
+    Lit les fichiers Parquet par période en mémoire mappée (pas de copie
+    intermédiaire du fichier) ; à défaut, retombe sur l'ancien cache pickle
+    exports_combined.pkl.
+
+    Args:
+        cache_dir: Dossier de cache du pipeline
+        periods: Liste de périodes (début, fin) à charger (toutes si None)
+        columns: Colonnes à charger (toutes si None)
+
+    Returns:
+        Dictionnaire {période: DataFrame}, vide si aucun cache n'existe
+    """
+    cache_dir = Path(cache_dir)
+    if periods is None:
+        prefix = len("exports_combined_")
+        parquet_files = {
+            f.stem[prefix:]: f for f in sorted(cache_dir.glob("exports_combined_*.parquet"))
+        }
+    else:
+        parquet_files = {
+            f"{start}_{end}": get_exports_cache_path(cache_dir, f"{start}_{end}")
+            for (start, end) in periods
+        }
+        parquet_files = {k: f for k, f in parquet_files.items() if f.exists()}
+    if parquet_files:
+        def read_one(f):
+            return pq.read_table(f, columns=columns, memory_map=True).to_pandas()
+
+        # Lectures des périodes en parallèle (pyarrow libère le GIL pendant les I/O et le décodage)
+        with ThreadPoolExecutor(max_workers=min(len(parquet_files), os.cpu_count() or 1)) as executor:
+            frames = list(executor.map(read_one, parquet_files.values()))
+        return dict(zip(parquet_files.keys(), frames))
+
+    legacy_file = cache_dir / "exports_combined.pkl"
+    if not legacy_file.exists():
+        return {}
+    logger.debug(f"Cache Parquet absent, lecture de l'ancien cache {legacy_file.name}")
+    with open(legacy_file, "rb") as f:
+        data = pickle.load(f)
+    if periods is not None:
+        wanted = {f"{start}_{end}" for (start, end) in periods}
+        data = {k: df for k, df in data.items() if k in wanted}
+    if columns is not None:
+        data = {k: df[columns] for k, df in data.items()}
+    return data
+
+
+def get_disasters_cache_path(cache_dir, year_start: int, year_end: int, legacy: bool = False) -> Path:
+    """
+    Retourne le chemin du cache des catastrophes pour une période.
+
+    Args:
+        cache_dir: Dossier de cache du pipeline
+        year_start: Première année de la période
+        year_end: Dernière année de la période
+        legacy: True pour l'ancien cache pickle (.pkl)
+
+    Returns:
+        Path vers disasters_combined_<début>_<fin>.parquet (ou .pkl)
+    """
+    suffix = "pkl" if legacy else "parquet"
+    return Path(cache_dir) / f"disasters_combined_{year_start}_{year_end}.{suffix}"
+
+
+def save_disasters_cache(df: pd.DataFrame, cache_dir, year_start: int, year_end: int) -> Path:
+    """
+    Sauvegarde le cache des catastrophes d'une période en Parquet (zstd).
+
+    Args:
+        df: DataFrame des catastrophes
+        cache_dir: Dossier de cache du pipeline
+        year_start: Première année de la période
+        year_end: Dernière année de la période
+
+    Returns:
+        Path du fichier écrit
+    """
+    cache_file = get_disasters_cache_path(cache_dir, year_start, year_end)
+    df.to_parquet(cache_file, engine="pyarrow", compression="zstd", index=False)
+    return cache_file
+
+
+def load_disasters_cache(
+    cache_dir, year_start: int, year_end: int, columns=None, legacy_pickle: bool = True
+):
+    """
+    Charge le cache des catastrophes produit par l'étape 02.
+
+    Lit le fichier Parquet de la période (colonnes demandées uniquement) ;
+    à défaut, et si legacy_pickle est vrai, retombe sur l'ancien cache pickle.
+
+    Args:
+        cache_dir: Dossier de cache du pipeline
+        year_start: Première année de la période
+        year_end: Dernière année de la période
+        columns: Colonnes à charger (toutes si None)
+        legacy_pickle: Autorise la lecture de l'ancien cache .pkl
+
+    Returns:
+        DataFrame des catastrophes, ou None si aucun cache n'existe
+    """
+    cache_file = get_disasters_cache_path(cache_dir, year_start, year_end)
+    if cache_file.exists():
+        return pq.read_table(cache_file, columns=columns, memory_map=True).to_pandas()
+    legacy_file = get_disasters_cache_path(cache_dir, year_start, year_end, legacy=True)
+    if legacy_pickle and legacy_file.exists():
+        logger.debug(f"Cache Parquet absent, lecture de l'ancien cache {legacy_file.name}")
+        df = pd.read_pickle(legacy_file)
+        return df[columns] if columns is not None else df
+    return None
+
+
+def read_excel_cached(source_file, cache_dir, columns=None, **read_excel_kwargs) -> pd.DataFrame:
+    """
+    Lit un fichier Excel via une copie Parquet mise en cache.
+
+    Le classeur n'est parsé (openpyxl) que si la copie Parquet est absente ou
+    plus ancienne que la source ; les lectures suivantes ne chargent que les
+    colonnes demandées depuis le Parquet. Si la feuille ne peut pas être
+    convertie en Parquet, le DataFrame lu est renvoyé sans mise en cache.
+
+    Args:
+        source_file: Chemin du fichier .xlsx source
+        cache_dir: Dossier de cache du pipeline
+        columns: Colonnes à charger (toutes si None)
+        **read_excel_kwargs: Arguments transmis à pd.read_excel (sheet_name, header, skiprows...)
+
+    Returns:
+        DataFrame lu depuis le cache Parquet ou depuis le fichier Excel
+    """
+    source_file = Path(source_file)
+    sheet = read_excel_kwargs.get("sheet_name")
+    suffix = f"_{sheet}" if isinstance(sheet, str) else ""
+    cache_file = Path(cache_dir) / f"{source_file.stem}{suffix}.parquet".replace(" ", "_")
+    if cache_file.exists() and cache_file.stat().st_mtime >= source_file.stat().st_mtime:
+        return pq.read_table(cache_file, columns=columns, memory_map=True).to_pandas()
+
+    df = pd.read_excel(source_file, **read_excel_kwargs)
+    # Colonnes objet mélangeant nombres et textes : texte (NaN conservés), identique avec ou sans cache
+    for col in df.columns[df.dtypes == object]:
+        if pd.api.types.infer_dtype(df[col], skipna=True).startswith("mixed"):
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    try:
+        df.to_parquet(cache_file, engine="pyarrow", compression="zstd", index=False)
+        logger.debug(f"Copie Parquet de {source_file.name} écrite : {cache_file}")
+    except Exception as e:
+        logger.debug(f"Pas de copie Parquet pour {source_file.name} : {e}")
+    return df[columns] if columns is not None else df
+
+
+def read_stata_cached(source_file, cache_dir, columns=None) -> pd.DataFrame:
+    """
+    Lit un fichier Stata (.dta) via une copie Parquet mise en cache.
+
+    Le .dta n'est parsé que si la copie Parquet est absente ou plus ancienne
+    que la source ; seules les colonnes demandées et présentes dans le fichier
+    sont ensuite chargées depuis le Parquet.
+
+    Args:
+        source_file: Chemin du fichier .dta source
+        cache_dir: Dossier de cache du pipeline
+        columns: Colonnes à charger si elles existent (toutes si None), ou
+            prédicat appelé sur chaque nom de colonne du fichier
+
+    Returns:
+        DataFrame lu depuis le cache Parquet ou depuis le fichier Stata
+    """
+    source_file = Path(source_file)
+    cache_file = Path(cache_dir) / f"{source_file.stem}.parquet".replace(" ", "_")
+    if not cache_file.exists() or cache_file.stat().st_mtime < source_file.stat().st_mtime:
+        df = pd.read_stata(source_file)
+        try:
+            df.to_parquet(cache_file, engine="pyarrow", compression="zstd", index=False)
+            logger.debug(f"Copie Parquet de {source_file.name} écrite : {cache_file}")
+        except Exception as e:
+            logger.debug(f"Pas de copie Parquet pour {source_file.name} : {e}")
+            if callable(columns):
+                return df[[c for c in df.columns if columns(c)]]
+            return df[[c for c in columns if c in df.columns]] if columns is not None else df
+    if callable(columns):
+        columns = [c for c in pq.read_schema(cache_file).names if columns(c)]
+    elif columns is not None:
+        available = set(pq.read_schema(cache_file).names)
+        columns = [c for c in columns if c in available]
+    return pq.read_table(cache_file, columns=columns, memory_map=True).to_pandas()
+
+
 def validate_dataframe_structure(
     df: pd.DataFrame, required_cols: list, df_name: str = "DataFrame"
 ) -> bool:
@@ -2,19 +2,25 @@ import pandas as pd
 import glob
 import os
 
+CHECK_COLS = ['ln_total_occurrence','ln_total_deaths','disaster_index']
+READ_COLS = {'is_agri', *CHECK_COLS}
+
 files = glob.glob('datasets/econometric_dataset_*.csv')
 for f in files:
-    df = pd.read_csv(f)
-    agri = df[df['is_agri']==True] if 'is_agri' in df.columns else pd.DataFrame()
+    # Seules les colonnes contrôlées sont lues (le dataset complet est très large)
+    df = pd.read_csv(f, usecols=lambda c: c in READ_COLS, engine="c")
+    agri_mask = (df['is_agri'] == True).to_numpy() if 'is_agri' in df.columns else None
     print(f'\n==== {os.path.basename(f)} ====')
-    for col in ['ln_total_occurrence','ln_total_deaths','disaster_index']:
-        if col in agri.columns:
-            n_na = agri[col].isna().sum()
-            n_tot = len(agri)
+    for col in CHECK_COLS:
+        if agri_mask is not None and col in df.columns:
+            n_na = int(df[col].isna().to_numpy()[agri_mask].sum())
+            n_tot = int(agri_mask.sum())
             print(f"{col}: {n_tot-n_na}/{n_tot} non-NA ({n_na} NA)")
         else:
             print(f"{col}: MISSING")
-    # Affiche un aperçu des premières lignes agri pour debug
-    if not agri.empty:
+    # Affiche un aperçu des premières lignes agri pour debug (toutes colonnes, lecture arrêtée après la 3e)
+    if agri_mask is not None and agri_mask.any():
+        first_rows = agri_mask.nonzero()[0][:3]
+        head = pd.read_csv(f, nrows=int(first_rows[-1]) + 1)
         print("Aperçu lignes agri:")
-        print(agri.head(3).to_string(index=False))
+        print(head.iloc[first_rows].to_string(index=False))
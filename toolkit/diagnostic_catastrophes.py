@@ -1,8 +1,10 @@
 import pandas as pd
 
+DISASTER_KEYS = ('deaths','events','affected','intensity','index')
+
 print('--- DIAGNOSTIC VARIABLES CATASTROPHES ---')
-df = pd.read_csv('datasets/econometric_dataset_1979_2000.csv')
-for col in df.columns:
-    if any(x in col for x in ['deaths','events','affected','intensity','index']):
-        n_nonzero = (df[col]!=0).sum()
-        print(f'{col:40s}  non-zero: {n_nonzero}')
+df = pd.read_csv('datasets/econometric_dataset_1979_2000.csv', usecols=lambda c: any(k in c for k in DISASTER_KEYS))
+# Un seul comptage vectorisé sur le bloc numpy (NaN compté comme non nul, comme df[col]!=0)
+counts = (df.to_numpy() != 0).sum(axis=0)
+for col, n_nonzero in zip(df.columns, counts):
+    print(f'{col:40s}  non-zero: {n_nonzero}')
@@ -814,6 +814,7 @@ def save_datasets_to_cache(
                     },
                 },
                 f,
+                protocol=pickle.HIGHEST_PROTOCOL,
             )
         logger.info(f"� Datasets sauvegardés dans le cache: {cache_file}")
     except Exception as e:
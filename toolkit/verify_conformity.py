@@ -182,7 +182,9 @@ def test_pipeline_execution():
         # Test exécution simple
         result = subprocess.run(
             ["python", str(PIPELINE_DIR / "run_pipeline.py"), "--force-refresh"],
-            capture_output=True,
+            # Seul stderr est exploité (message d'échec) : stdout de toute la pipeline non bufferisé
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             cwd=PROJECT_ROOT,
             timeout=300,